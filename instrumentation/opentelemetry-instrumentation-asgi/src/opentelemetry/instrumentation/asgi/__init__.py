@@ -597,22 +597,21 @@ class OpenTelemetryMiddleware:
         try:
             with trace.use_span(span, end_on_exit=False) as current_span:
                 if current_span.is_recording():
-                    for key, value in attributes.items():
-                        current_span.set_attribute(key, value)
-
-                    if current_span.kind == trace.SpanKind.SERVER:
-                        custom_attributes = (
-                            collect_custom_headers_attributes(
+                    span_attributes = attributes
+                    if (
+                        current_span.kind == trace.SpanKind.SERVER
+                        and self.http_capture_headers_server_request
+                    ):
+                        span_attributes = {
+                            **attributes,
+                            **collect_custom_headers_attributes(
                                 scope,
                                 self.http_capture_headers_sanitize_fields,
                                 self.http_capture_headers_server_request,
                                 normalise_request_header_name,
-                            )
-                            if self.http_capture_headers_server_request
-                            else {}
-                        )
-                        if len(custom_attributes) > 0:
-                            current_span.set_attributes(custom_attributes)
+                            ),
+                        }
+                    current_span.set_attributes(span_attributes)
 
                 if callable(self.server_request_hook):
                     self.server_request_hook(current_span, scope)
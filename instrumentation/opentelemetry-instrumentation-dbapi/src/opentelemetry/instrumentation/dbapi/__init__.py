@@ -275,6 +275,7 @@ class DatabaseApiIntegration:
         self.name = ""
         self.database = ""
         self.connect_module = connect_module
+        self._cursor_tracer = None
 
     def wrapped_connection(
         self,
@@ -321,39 +322,41 @@ class DatabaseApiIntegration:
             self.span_attributes[SpanAttributes.NET_PEER_PORT] = port
 
 
-def get_traced_connection_proxy(
-    connection, db_api_integration, *args, **kwargs
-):
-    # pylint: disable=abstract-method
-    class TracedConnectionProxy(wrapt.ObjectProxy):
-        # pylint: disable=unused-argument
-        def __init__(self, connection, *args, **kwargs):
-            wrapt.ObjectProxy.__init__(self, connection)
-
-        def __getattribute__(self, name):
-            if object.__getattribute__(self, name):
-                return object.__getattribute__(self, name)
-
-            return object.__getattribute__(
-                object.__getattribute__(self, "_connection"), name
-            )
+# pylint: disable=abstract-method
+class TracedConnectionProxy(wrapt.ObjectProxy):
+    # Attribute access falls through to wrapt's C-level delegation; only the
+    # methods below are intercepted.
 
-        def cursor(self, *args, **kwargs):
-            return get_traced_cursor_proxy(
-                self.__wrapped__.cursor(*args, **kwargs), db_api_integration
-            )
+    # pylint: disable=unused-argument
+    def __init__(self, connection, db_api_integration, *args, **kwargs):
+        wrapt.ObjectProxy.__init__(self, connection)
+        self._self_db_api_integration = db_api_integration
+
+    def cursor(self, *args, **kwargs):
+        return get_traced_cursor_proxy(
+            self.__wrapped__.cursor(*args, **kwargs),
+            self._self_db_api_integration,
+        )
 
-        def __enter__(self):
-            self.__wrapped__.__enter__()
-            return self
+    def __enter__(self):
+        self.__wrapped__.__enter__()
+        return self
 
-        def __exit__(self, *args, **kwargs):
-            self.__wrapped__.__exit__(*args, **kwargs)
+    def __exit__(self, *args, **kwargs):
+        self.__wrapped__.__exit__(*args, **kwargs)
 
-    return TracedConnectionProxy(connection, *args, **kwargs)
+
+def get_traced_connection_proxy(
+    connection, db_api_integration, *args, **kwargs
+):
+    return TracedConnectionProxy(
+        connection, db_api_integration, *args, **kwargs
+    )
 
 
 class CursorTracer:
+    _leading_comment_remover = re.compile(r"^/\*.*?\*/")
+
     def __init__(self, db_api_integration: DatabaseApiIntegration) -> None:
         self._db_api_integration = db_api_integration
         self._commenter_enabled = self._db_api_integration.enable_commenter
@@ -363,7 +366,38 @@ class CursorTracer:
             else {}
         )
         self._connect_module = self._db_api_integration.connect_module
-        self._leading_comment_remover = re.compile(r"^/\*.*?\*/")
+        self._driver_commenter_data = None
+
+    def _get_driver_commenter_data(self):
+        # The driver details cannot change while the connect module is
+        # loaded, so they are read and filtered once instead of on every
+        # query.
+        if self._driver_commenter_data is None:
+            if hasattr(self._connect_module, "__libpq_version__"):
+                libpq_version = self._connect_module.__libpq_version__
+            else:
+                libpq_version = self._connect_module.pq.__build_version__
+
+            driver_commenter_data = {
+                # Psycopg2/framework information
+                "db_driver": f"psycopg2:{self._connect_module.__version__.split(' ')[0]}",
+                "dbapi_threadsafety": self._connect_module.threadsafety,
+                "dbapi_level": self._connect_module.apilevel,
+                "libpq_version": libpq_version,
+                "driver_paramstyle": self._connect_module.paramstyle,
+            }
+            self._driver_commenter_data = self._filter_commenter_data(
+                driver_commenter_data
+            )
+        return self._driver_commenter_data
+
+    def _filter_commenter_data(self, commenter_data):
+        # Filter down to just the requested attributes.
+        return {
+            k: v
+            for k, v in commenter_data.items()
+            if self._commenter_options.get(k, True)
+        }
 
     def _populate_span(
         self,
@@ -373,23 +407,19 @@ class CursorTracer:
     ):
         if not span.is_recording():
             return
-        statement = self.get_statement(cursor, args)
-        span.set_attribute(
-            SpanAttributes.DB_SYSTEM, self._db_api_integration.database_system
-        )
-        span.set_attribute(
-            SpanAttributes.DB_NAME, self._db_api_integration.database
-        )
-        span.set_attribute(SpanAttributes.DB_STATEMENT, statement)
-
-        for (
-            attribute_key,
-            attribute_value,
-        ) in self._db_api_integration.span_attributes.items():
-            span.set_attribute(attribute_key, attribute_value)
+        # Collect everything into one dict so the span is updated once;
+        # the connection attributes were resolved when it was wrapped.
+        attributes = {
+            SpanAttributes.DB_SYSTEM: self._db_api_integration.database_system,
+            SpanAttributes.DB_NAME: self._db_api_integration.database,
+            SpanAttributes.DB_STATEMENT: self.get_statement(cursor, args),
+            **self._db_api_integration.span_attributes,
+        }
 
         if self._db_api_integration.capture_parameters and len(args) > 1:
-            span.set_attribute("db.statement.parameters", str(args[1]))
+            attributes["db.statement.parameters"] = str(args[1])
+
+        span.set_attributes(attributes)
 
     def get_operation_name(self, cursor, args):  # pylint: disable=no-self-use
         if args and isinstance(args[0], str):
@@ -427,32 +457,16 @@ class CursorTracer:
             if args and self._commenter_enabled:
                 try:
                     args_list = list(args)
-                    if hasattr(self._connect_module, "__libpq_version__"):
-                        libpq_version = self._connect_module.__libpq_version__
-                    else:
-                        libpq_version = (
-                            self._connect_module.pq.__build_version__
-                        )
-
-                    commenter_data = {
-                        # Psycopg2/framework information
-                        "db_driver": f"psycopg2:{self._connect_module.__version__.split(' ')[0]}",
-                        "dbapi_threadsafety": self._connect_module.threadsafety,
-                        "dbapi_level": self._connect_module.apilevel,
-                        "libpq_version": libpq_version,
-                        "driver_paramstyle": self._connect_module.paramstyle,
-                    }
+                    commenter_data = dict(self._get_driver_commenter_data())
                     if self._commenter_options.get(
                         "opentelemetry_values", True
                     ):
-                        commenter_data.update(**_get_opentelemetry_values())
-
-                    # Filter down to just the requested attributes.
-                    commenter_data = {
-                        k: v
-                        for k, v in commenter_data.items()
-                        if self._commenter_options.get(k, True)
-                    }
+                        commenter_data.update(
+                            self._filter_commenter_data(
+                                _get_opentelemetry_values()
+                            )
+                        )
+
                     statement = _add_sql_comment(
                         args_list[0], **commenter_data
                     )
@@ -467,35 +481,42 @@ class CursorTracer:
             return query_method(*args, **kwargs)
 
 
-def get_traced_cursor_proxy(cursor, db_api_integration, *args, **kwargs):
-    _cursor_tracer = CursorTracer(db_api_integration)
+# pylint: disable=abstract-method
+class TracedCursorProxy(wrapt.ObjectProxy):
+    # pylint: disable=unused-argument
+    def __init__(self, cursor, cursor_tracer, *args, **kwargs):
+        wrapt.ObjectProxy.__init__(self, cursor)
+        self._self_cursor_tracer = cursor_tracer
 
-    # pylint: disable=abstract-method
-    class TracedCursorProxy(wrapt.ObjectProxy):
-        # pylint: disable=unused-argument
-        def __init__(self, cursor, *args, **kwargs):
-            wrapt.ObjectProxy.__init__(self, cursor)
+    def execute(self, *args, **kwargs):
+        return self._self_cursor_tracer.traced_execution(
+            self.__wrapped__, self.__wrapped__.execute, *args, **kwargs
+        )
 
-        def execute(self, *args, **kwargs):
-            return _cursor_tracer.traced_execution(
-                self.__wrapped__, self.__wrapped__.execute, *args, **kwargs
-            )
+    def executemany(self, *args, **kwargs):
+        return self._self_cursor_tracer.traced_execution(
+            self.__wrapped__, self.__wrapped__.executemany, *args, **kwargs
+        )
 
-        def executemany(self, *args, **kwargs):
-            return _cursor_tracer.traced_execution(
-                self.__wrapped__, self.__wrapped__.executemany, *args, **kwargs
-            )
+    def callproc(self, *args, **kwargs):
+        return self._self_cursor_tracer.traced_execution(
+            self.__wrapped__, self.__wrapped__.callproc, *args, **kwargs
+        )
 
-        def callproc(self, *args, **kwargs):
-            return _cursor_tracer.traced_execution(
-                self.__wrapped__, self.__wrapped__.callproc, *args, **kwargs
-            )
+    def __enter__(self):
+        self.__wrapped__.__enter__()
+        return self
+
+    def __exit__(self, *args, **kwargs):
+        self.__wrapped__.__exit__(*args, **kwargs)
 
-        def __enter__(self):
-            self.__wrapped__.__enter__()
-            return self
 
-        def __exit__(self, *args, **kwargs):
-            self.__wrapped__.__exit__(*args, **kwargs)
+def get_traced_cursor_proxy(cursor, db_api_integration, *args, **kwargs):
+    # All cursors created through the same integration share one tracer.
+    # pylint: disable=protected-access
+    if db_api_integration._cursor_tracer is None:
+        db_api_integration._cursor_tracer = CursorTracer(db_api_integration)
 
-    return TracedCursorProxy(cursor, *args, **kwargs)
+    return TracedCursorProxy(
+        cursor, db_api_integration._cursor_tracer, *args, **kwargs
+    )
@@ -21,12 +21,48 @@ from opentelemetry import trace as trace_api
 from opentelemetry.instrumentation import dbapi
 from opentelemetry.sdk import resources
 from opentelemetry.semconv.trace import SpanAttributes
+from opentelemetry.test.globals_test import reset_trace_globals
 from opentelemetry.test.test_base import TestBase
 
+# Used by tests that never read exported spans, so they don't pay for the
+# SDK span pipeline
+_NO_OP_TRACER_PROVIDER = trace_api.NoOpTracerProvider()
+
+_MULTILINE_QUERY = "multi\nline\nquery"
+
+# One query per span-name code path: whitespace split, multi-line split and
+# leading/trailing comment handling. Each case holds the execute() args and
+# the expected span name.
+_SPAN_NAME_CASES = (
+    (("Test query", ("param1Value", False)), "Test"),
+    ((_MULTILINE_QUERY,), "multi"),
+    (("/* leading comment */ query /* trailing comment */",), "query"),
+)
+
+_OPERATION_NAME_CASES = _SPAN_NAME_CASES + (
+    (("tab\tseparated query",), "tab"),
+    (("/* leading comment */ query",), "query"),
+    (("query /* trailing comment */",), "query"),
+)
+
 
 class TestDBApiIntegration(TestBase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # Build the tracer provider once for the whole class, setUp only
+        # has to reinstall it globally and clear previously exported spans
+        cls._tracer_provider_and_exporter = cls.create_tracer_provider()
+
     def setUp(self):
         super().setUp()
+        (
+            self.tracer_provider,
+            self.memory_exporter,
+        ) = self._tracer_provider_and_exporter
+        reset_trace_globals()
+        trace_api.set_tracer_provider(self.tracer_provider)
+        self.memory_exporter.clear()
         self.tracer = self.tracer_provider.get_tracer(__name__)
 
     def test_span_succeeded(self):
@@ -81,24 +117,26 @@ class TestDBApiIntegration(TestBase):
             mock_connect, {}, {}
         )
         cursor = mock_connection.cursor()
-        cursor.execute("Test query", ("param1Value", False))
-        cursor.execute(
-            """multi
-        line
-        query"""
-        )
-        cursor.execute("tab\tseparated query")
-        cursor.execute("/* leading comment */ query")
-        cursor.execute("/* leading comment */ query /* trailing comment */")
-        cursor.execute("query /* trailing comment */")
+        for args, _ in _SPAN_NAME_CASES:
+            cursor.execute(*args)
         spans_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(spans_list), 6)
-        self.assertEqual(spans_list[0].name, "Test")
-        self.assertEqual(spans_list[1].name, "multi")
-        self.assertEqual(spans_list[2].name, "tab")
-        self.assertEqual(spans_list[3].name, "query")
-        self.assertEqual(spans_list[4].name, "query")
-        self.assertEqual(spans_list[5].name, "query")
+        self.assertEqual(
+            [span.name for span in spans_list],
+            [name for _, name in _SPAN_NAME_CASES],
+        )
+
+    def test_get_operation_name(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            "testname",
+            "testcomponent",
+            tracer_provider=_NO_OP_TRACER_PROVIDER,
+        )
+        cursor_tracer = dbapi.CursorTracer(db_integration)
+        for args, name in _OPERATION_NAME_CASES:
+            with self.subTest(query=args[0]):
+                self.assertEqual(
+                    cursor_tracer.get_operation_name(None, args), name
+                )
 
     def test_span_succeeded_with_capture_of_statement_parameters(self):
         connection_props = {
@@ -166,7 +204,10 @@ class TestDBApiIntegration(TestBase):
         mock_span = mock.Mock()
         mock_span.is_recording.return_value = False
         db_integration = dbapi.DatabaseApiIntegration(
-            "testname", "testcomponent", connection_attributes
+            "testname",
+            "testcomponent",
+            connection_attributes,
+            tracer_provider=_NO_OP_TRACER_PROVIDER,
         )
         mock_connection = db_integration.wrapped_connection(
             mock_connect, {}, connection_props
@@ -349,16 +390,47 @@ class TestDBApiIntegration(TestBase):
             "Test stored procedure",
         )
 
+    def test_cursors_share_tracer(self):
+        db_integration = dbapi.DatabaseApiIntegration(
+            "testname", "testcomponent"
+        )
+        mock_connection = db_integration.wrapped_connection(
+            mock_connect, {}, {}
+        )
+        cursor1 = mock_connection.cursor()
+        cursor2 = mock_connection.cursor()
+        self.assertIs(type(cursor1), dbapi.TracedCursorProxy)
+        self.assertIsNot(cursor1.__wrapped__, cursor2.__wrapped__)
+        # pylint: disable=protected-access
+        self.assertIs(cursor1._self_cursor_tracer, cursor2._self_cursor_tracer)
+
+        cursor1.execute("Test query")
+        cursor2.execute("Test query")
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans_list), 2)
+
     @mock.patch("opentelemetry.instrumentation.dbapi")
     def test_wrap_connect(self, mock_dbapi):
-        dbapi.wrap_connect(self.tracer, mock_dbapi, "connect", "-")
+        dbapi.wrap_connect(
+            self.tracer,
+            mock_dbapi,
+            "connect",
+            "-",
+            tracer_provider=_NO_OP_TRACER_PROVIDER,
+        )
         connection = mock_dbapi.connect()
         self.assertEqual(mock_dbapi.connect.call_count, 1)
         self.assertIsInstance(connection.__wrapped__, mock.Mock)
 
     @mock.patch("opentelemetry.instrumentation.dbapi")
     def test_unwrap_connect(self, mock_dbapi):
-        dbapi.wrap_connect(self.tracer, mock_dbapi, "connect", "-")
+        dbapi.wrap_connect(
+            self.tracer,
+            mock_dbapi,
+            "connect",
+            "-",
+            tracer_provider=_NO_OP_TRACER_PROVIDER,
+        )
         connection = mock_dbapi.connect()
         self.assertEqual(mock_dbapi.connect.call_count, 1)
 
@@ -371,15 +443,38 @@ class TestDBApiIntegration(TestBase):
         connection = mock.Mock()
         # Avoid get_attributes failing because can't concatenate mock
         connection.database = "-"
-        connection2 = dbapi.instrument_connection(self.tracer, connection, "-")
+        connection2 = dbapi.instrument_connection(
+            self.tracer,
+            connection,
+            "-",
+            tracer_provider=_NO_OP_TRACER_PROVIDER,
+        )
         self.assertIs(connection2.__wrapped__, connection)
 
+    def test_instrumented_connection_attributes(self):
+        connection = MockConnection("testdatabase", 0, "testhost", "")
+        connection2 = dbapi.instrument_connection(
+            self.tracer,
+            connection,
+            "testcomponent",
+            tracer_provider=_NO_OP_TRACER_PROVIDER,
+        )
+        # falsy attributes must be read from the wrapped connection too
+        self.assertEqual(connection2.database, "testdatabase")
+        self.assertEqual(connection2.server_port, 0)
+        self.assertEqual(connection2.user, "")
+
     def test_uninstrument_connection(self):
         connection = mock.Mock()
         # Set connection.database to avoid a failure because mock can't
         # be concatenated
         connection.database = "-"
-        connection2 = dbapi.instrument_connection(self.tracer, connection, "-")
+        connection2 = dbapi.instrument_connection(
+            self.tracer,
+            connection,
+            "-",
+            tracer_provider=_NO_OP_TRACER_PROVIDER,
+        )
         self.assertIs(connection2.__wrapped__, connection)
 
         connection3 = dbapi.uninstrument_connection(connection2)
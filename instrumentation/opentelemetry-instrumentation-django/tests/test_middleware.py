@@ -16,7 +16,7 @@
 
 from sys import modules
 from timeit import default_timer
-from unittest.mock import Mock, patch
+from unittest.mock import patch
 
 from django import VERSION, conf
 from django.http import HttpRequest, HttpResponse
@@ -33,8 +33,11 @@ from opentelemetry.instrumentation.propagators import (
     set_global_response_propagator,
 )
 from opentelemetry.sdk import resources
+from opentelemetry.sdk.metrics import Histogram, MeterProvider, UpDownCounter
 from opentelemetry.sdk.metrics.export import (
+    AggregationTemporality,
     HistogramDataPoint,
+    InMemoryMetricReader,
     NumberDataPoint,
 )
 from opentelemetry.sdk.trace import Span
@@ -42,6 +45,8 @@ from opentelemetry.sdk.trace.id_generator import RandomIdGenerator
 from opentelemetry.semconv.trace import SpanAttributes
 from opentelemetry.test.wsgitestutil import WsgiTestBase
 from opentelemetry.trace import (
+    INVALID_SPAN_CONTEXT,
+    NonRecordingSpan,
     SpanKind,
     StatusCode,
     format_span_id,
@@ -53,8 +58,6 @@ from opentelemetry.util.http import (
     OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE,
     _active_requests_count_attrs,
     _duration_attrs,
-    get_excluded_urls,
-    get_traced_request_attrs,
 )
 
 # pylint: disable=import-error
@@ -83,23 +86,77 @@ else:
 
 
 urlpatterns = [
-    re_path(r"^traced/", traced),
-    re_path(r"^traced_custom_header/", response_with_custom_header),
+    path("traced/", traced),
+    path("traced_custom_header/", response_with_custom_header),
     re_path(r"^route/(?P<year>[0-9]{4})/template/$", traced_template),
-    re_path(r"^error/", error),
+    path("error/", error),
     re_path(r"^excluded_arg/", excluded),
-    re_path(r"^excluded_noarg/", excluded_noarg),
-    re_path(r"^excluded_noarg2/", excluded_noarg2),
+    path("excluded_noarg/", excluded_noarg),
+    path("excluded_noarg2/", excluded_noarg2),
     re_path(r"^span_name/([0-9]{4})/$", route_span_name),
     path("", traced, name="empty"),
 ]
 _django_instrumentor = DjangoInstrumentor()
+_ID_GENERATOR = RandomIdGenerator()
+
+_HTTP_METHOD = SpanAttributes.HTTP_METHOD
+_HTTP_URL = SpanAttributes.HTTP_URL
+_HTTP_ROUTE = SpanAttributes.HTTP_ROUTE
+_HTTP_SCHEME = SpanAttributes.HTTP_SCHEME
+_HTTP_STATUS_CODE = SpanAttributes.HTTP_STATUS_CODE
+_EXC_TYPE = SpanAttributes.EXCEPTION_TYPE
+_EXC_MSG = SpanAttributes.EXCEPTION_MESSAGE
+
+_RECOMMENDED_ATTRS = {
+    "http.server.active_requests": frozenset(_active_requests_count_attrs),
+    "http.server.duration": frozenset(_duration_attrs),
+}
+
+_EXCLUDED_URLS = "http://testserver/excluded_arg/123,excluded_noarg"
+_TRACED_REQUEST_ATTRS = ["path_info", "content_type", "non_existing_variable"]
+
+_EXPECTED_TRACED_NAME = "GET traced/" if DJANGO_2_2 else "GET"
+_EXPECTED_POST_TRACED_NAME = "POST traced/" if DJANGO_2_2 else "POST"
+_EXPECTED_ERROR_NAME = "GET error/" if DJANGO_2_2 else "GET"
+_EXPECTED_ROUTE_TEMPLATE_NAME = (
+    "GET ^route/(?P<year>[0-9]{4})/template/$" if DJANGO_2_2 else "GET"
+)
+_EXPECTED_SPAN_NAME_ROUTE_NAME = (
+    "GET ^span_name/([0-9]{4})/$" if DJANGO_2_2 else "GET"
+)
 
-
-# pylint: disable=too-many-public-methods
-class TestMiddleware(WsgiTestBase):
-    @classmethod
-    def setUpClass(cls):
+_CUSTOM_HEADERS_ENVIRON = {
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
+}
+
+_EXPECTED_REQUEST_HEADERS = {
+    "http.request.header.custom_test_header_1": ("test-header-value-1",),
+    "http.request.header.custom_test_header_2": ("test-header-value-2",),
+    "http.request.header.regex_test_header_1": ("Regex Test Value 1",),
+    "http.request.header.regex_test_header_2": (
+        "RegexTestValue2,RegexTestValue3",
+    ),
+    "http.request.header.my_secret_header": ("[REDACTED]",),
+}
+
+_EXPECTED_RESPONSE_HEADERS = {
+    "http.response.header.custom_test_header_1": ("test-header-value-1",),
+    "http.response.header.custom_test_header_2": ("test-header-value-2",),
+    "http.response.header.my_custom_regex_header_1": (
+        "my-custom-regex-value-1,my-custom-regex-value-2",
+    ),
+    "http.response.header.my_custom_regex_header_2": (
+        "my-custom-regex-value-3,my-custom-regex-value-4",
+    ),
+    "http.response.header.my_secret_header": ("[REDACTED]",),
+}
+
+
+def setUpModule():  # pylint: disable=invalid-name
+    # All test classes in this module share the same settings
+    if not conf.settings.configured:
         conf.settings.configure(
             ROOT_URLCONF=modules[__name__],
             DATABASES={
@@ -107,113 +164,149 @@ class TestMiddleware(WsgiTestBase):
                 "other": {},
             },  # db.connections gets populated only at first test execution
         )
-        super().setUpClass()
 
-    def setUp(self):
-        super().setUp()
+
+def tearDownModule():  # pylint: disable=invalid-name
+    # Let the next test module configure its own settings
+    conf.settings = conf.LazySettings()
+
+
+class _TrackingNonRecordingSpan(NonRecordingSpan):
+    is_recording_called = False
+    set_attribute_called = False
+    set_status_called = False
+
+    def is_recording(self):
+        self.is_recording_called = True
+        return False
+
+    def set_attribute(self, key, value):
+        self.set_attribute_called = True
+
+    def set_status(self, status, description=None):
+        self.set_status_called = True
+
+
+class _StubTracer:
+    def __init__(self, span):
+        self._span = span
+
+    # pylint: disable=unused-argument
+    def start_span(self, *args, **kwargs):
+        return self._span
+
+
+# pylint: disable=too-many-public-methods
+class TestMiddleware(WsgiTestBase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
         setup_test_environment()
-        _django_instrumentor.instrument()
-        self.env_patch = patch.dict(
-            "os.environ",
-            {
-                "OTEL_PYTHON_DJANGO_EXCLUDED_URLS": "http://testserver/excluded_arg/123,excluded_noarg",
-                "OTEL_PYTHON_DJANGO_TRACED_REQUEST_ATTRS": "path_info,content_type,non_existing_variable",
-            },
+        # Instrument once for the whole class, the providers are built here
+        # because the middleware keeps the tracer and meter it was
+        # instrumented with. The metric reader uses delta temporality so
+        # each test only sees the measurements recorded since its setUp.
+        cls.tracer_provider, cls.memory_exporter = cls.create_tracer_provider()
+        cls.memory_metrics_reader = InMemoryMetricReader(
+            preferred_temporality={
+                Histogram: AggregationTemporality.DELTA,
+                UpDownCounter: AggregationTemporality.DELTA,
+            }
         )
-        self.env_patch.start()
-        self.exclude_patch = patch(
-            "opentelemetry.instrumentation.django.middleware.otel_middleware._DjangoMiddleware._excluded_urls",
-            get_excluded_urls("DJANGO"),
+        cls.meter_provider = MeterProvider(
+            metric_readers=[cls.memory_metrics_reader]
         )
-        self.traced_patch = patch(
+        cls.traced_patch = patch(
             "opentelemetry.instrumentation.django.middleware.otel_middleware._DjangoMiddleware._traced_request_attrs",
-            get_traced_request_attrs("DJANGO"),
+            _TRACED_REQUEST_ATTRS,
         )
-        self.exclude_patch.start()
-        self.traced_patch.start()
+        cls.traced_patch.start()
+        cls._instrument()
+
+    @classmethod
+    def _instrument(cls, **kwargs):
+        kwargs.setdefault("excluded_urls", _EXCLUDED_URLS)
+        _django_instrumentor.instrument(
+            tracer_provider=cls.tracer_provider,
+            meter_provider=cls.meter_provider,
+            **kwargs,
+        )
+
+    def setUp(self):
+        super().setUp()
+        # TestBase.setUp builds fresh providers, the tests have to read from
+        # the ones the class was instrumented with
+        cls = type(self)
+        self.tracer_provider = cls.tracer_provider
+        self.memory_exporter = cls.memory_exporter
+        self.meter_provider = cls.meter_provider
+        self.memory_metrics_reader = cls.memory_metrics_reader
+        self.memory_metrics_reader.get_metrics_data()
+        self.client = Client()
 
     def tearDown(self):
         super().tearDown()
-        self.env_patch.stop()
-        self.exclude_patch.stop()
-        self.traced_patch.stop()
-        teardown_test_environment()
-        _django_instrumentor.uninstrument()
+        self.memory_exporter.clear()
 
     @classmethod
     def tearDownClass(cls):
         super().tearDownClass()
-        conf.settings = conf.LazySettings()
+        teardown_test_environment()
+        _django_instrumentor.uninstrument()
+        cls.traced_patch.stop()
 
     def test_templated_route_get(self):
-        Client().get("/route/2020/template/")
+        self.client.get("/route/2020/template/")
 
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 1)
 
         span = spans[0]
 
-        self.assertEqual(
-            span.name,
-            (
-                "GET ^route/(?P<year>[0-9]{4})/template/$"
-                if DJANGO_2_2
-                else "GET"
-            ),
-        )
+        self.assertEqual(span.name, _EXPECTED_ROUTE_TEMPLATE_NAME)
         self.assertEqual(span.kind, SpanKind.SERVER)
         self.assertEqual(span.status.status_code, StatusCode.UNSET)
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_METHOD], "GET")
-        self.assertEqual(
-            span.attributes[SpanAttributes.HTTP_URL],
-            "http://testserver/route/2020/template/",
-        )
+        expected = {
+            _HTTP_METHOD: "GET",
+            _HTTP_URL: "http://testserver/route/2020/template/",
+            _HTTP_SCHEME: "http",
+            _HTTP_STATUS_CODE: 200,
+        }
         if DJANGO_2_2:
-            self.assertEqual(
-                span.attributes[SpanAttributes.HTTP_ROUTE],
-                "^route/(?P<year>[0-9]{4})/template/$",
-            )
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_SCHEME], "http")
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_STATUS_CODE], 200)
+            expected[_HTTP_ROUTE] = "^route/(?P<year>[0-9]{4})/template/$"
+        self.assertSpanHasAttributes(span, expected)
 
     def test_traced_get(self):
-        Client().get("/traced/")
+        self.client.get("/traced/")
 
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 1)
 
         span = spans[0]
 
-        self.assertEqual(span.name, "GET ^traced/" if DJANGO_2_2 else "GET")
+        self.assertEqual(span.name, _EXPECTED_TRACED_NAME)
         self.assertEqual(span.kind, SpanKind.SERVER)
         self.assertEqual(span.status.status_code, StatusCode.UNSET)
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_METHOD], "GET")
-        self.assertEqual(
-            span.attributes[SpanAttributes.HTTP_URL],
-            "http://testserver/traced/",
-        )
+        expected = {
+            _HTTP_METHOD: "GET",
+            _HTTP_URL: "http://testserver/traced/",
+            _HTTP_SCHEME: "http",
+            _HTTP_STATUS_CODE: 200,
+        }
         if DJANGO_2_2:
-            self.assertEqual(
-                span.attributes[SpanAttributes.HTTP_ROUTE], "^traced/"
-            )
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_SCHEME], "http")
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_STATUS_CODE], 200)
+            expected[_HTTP_ROUTE] = "traced/"
+        self.assertSpanHasAttributes(span, expected)
 
     def test_not_recording(self):
-        mock_tracer = Mock()
-        mock_span = Mock()
-        mock_span.is_recording.return_value = False
-        mock_tracer.start_span.return_value = mock_span
-        with patch("opentelemetry.trace.get_tracer") as tracer:
-            tracer.return_value = mock_tracer
-            Client().get("/traced/")
-            self.assertFalse(mock_span.is_recording())
-            self.assertTrue(mock_span.is_recording.called)
-            self.assertFalse(mock_span.set_attribute.called)
-            self.assertFalse(mock_span.set_status.called)
+        span = _TrackingNonRecordingSpan(INVALID_SPAN_CONTEXT)
+        with patch.object(_DjangoMiddleware, "_tracer", _StubTracer(span)):
+            self.client.get("/traced/")
+        self.assertTrue(span.is_recording_called)
+        self.assertFalse(span.set_attribute_called)
+        self.assertFalse(span.set_status_called)
 
     def test_empty_path(self):
-        Client().get("/")
+        self.client.get("/")
 
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 1)
@@ -223,120 +316,105 @@ class TestMiddleware(WsgiTestBase):
         self.assertEqual(span.name, "GET empty")
 
     def test_traced_post(self):
-        Client().post("/traced/")
+        self.client.post("/traced/")
 
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 1)
 
         span = spans[0]
 
-        self.assertEqual(span.name, "POST ^traced/" if DJANGO_2_2 else "POST")
+        self.assertEqual(span.name, _EXPECTED_POST_TRACED_NAME)
         self.assertEqual(span.kind, SpanKind.SERVER)
         self.assertEqual(span.status.status_code, StatusCode.UNSET)
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_METHOD], "POST")
-        self.assertEqual(
-            span.attributes[SpanAttributes.HTTP_URL],
-            "http://testserver/traced/",
-        )
+        expected = {
+            _HTTP_METHOD: "POST",
+            _HTTP_URL: "http://testserver/traced/",
+            _HTTP_SCHEME: "http",
+            _HTTP_STATUS_CODE: 200,
+        }
         if DJANGO_2_2:
-            self.assertEqual(
-                span.attributes[SpanAttributes.HTTP_ROUTE], "^traced/"
-            )
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_SCHEME], "http")
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_STATUS_CODE], 200)
+            expected[_HTTP_ROUTE] = "traced/"
+        self.assertSpanHasAttributes(span, expected)
 
     def test_error(self):
         with self.assertRaises(ValueError):
-            Client().get("/error/")
+            self.client.get("/error/")
 
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 1)
 
         span = spans[0]
 
-        self.assertEqual(span.name, "GET ^error/" if DJANGO_2_2 else "GET")
+        self.assertEqual(span.name, _EXPECTED_ERROR_NAME)
         self.assertEqual(span.kind, SpanKind.SERVER)
         self.assertEqual(span.status.status_code, StatusCode.ERROR)
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_METHOD], "GET")
-        self.assertEqual(
-            span.attributes[SpanAttributes.HTTP_URL],
-            "http://testserver/error/",
-        )
+        expected = {
+            _HTTP_METHOD: "GET",
+            _HTTP_URL: "http://testserver/error/",
+            _HTTP_SCHEME: "http",
+            _HTTP_STATUS_CODE: 500,
+        }
         if DJANGO_2_2:
-            self.assertEqual(
-                span.attributes[SpanAttributes.HTTP_ROUTE], "^error/"
-            )
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_SCHEME], "http")
-        self.assertEqual(span.attributes[SpanAttributes.HTTP_STATUS_CODE], 500)
+            expected[_HTTP_ROUTE] = "error/"
+        self.assertSpanHasAttributes(span, expected)
 
         self.assertEqual(len(span.events), 1)
         event = span.events[0]
         self.assertEqual(event.name, "exception")
-        self.assertEqual(
-            event.attributes[SpanAttributes.EXCEPTION_TYPE], "ValueError"
-        )
-        self.assertEqual(
-            event.attributes[SpanAttributes.EXCEPTION_MESSAGE], "error"
-        )
+        self.assertEqual(event.attributes[_EXC_TYPE], "ValueError")
+        self.assertEqual(event.attributes[_EXC_MSG], "error")
 
     def test_exclude_lists(self):
-        client = Client()
-        client.get("/excluded_arg/123")
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 0)
-
-        client.get("/excluded_arg/125")
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 1)
-
-        client.get("/excluded_noarg/")
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 1)
+        self.client.get("/excluded_arg/123")
+        self.client.get("/excluded_arg/125")
+        self.client.get("/excluded_noarg/")
+        self.client.get("/excluded_noarg2/")
 
-        client.get("/excluded_noarg2/")
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 1)
+        self.assertEqual(
+            span_list[0].attributes[_HTTP_URL],
+            "http://testserver/excluded_arg/125",
+        )
 
     def test_exclude_lists_through_instrument(self):
         _django_instrumentor.uninstrument()
-        _django_instrumentor.instrument(excluded_urls="excluded_explicit")
-        client = Client()
-        client.get("/excluded_explicit")
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 0)
-
-        client.get("/excluded_arg/123")
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 1)
+        self._instrument(excluded_urls="excluded_explicit")
+        try:
+            self.client.get("/excluded_explicit")
+            self.client.get("/excluded_arg/123")
+            span_list = self.memory_exporter.get_finished_spans()
+            self.assertEqual(len(span_list), 1)
+            self.assertEqual(
+                span_list[0].attributes[_HTTP_URL],
+                "http://testserver/excluded_arg/123",
+            )
+        finally:
+            _django_instrumentor.uninstrument()
+            self._instrument()
 
     def test_span_name(self):
         # test no query_string
-        Client().get("/span_name/1234/")
+        self.client.get("/span_name/1234/")
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 1)
 
         span = span_list[0]
-        self.assertEqual(
-            span.name,
-            "GET ^span_name/([0-9]{4})/$" if DJANGO_2_2 else "GET",
-        )
+        self.assertEqual(span.name, _EXPECTED_SPAN_NAME_ROUTE_NAME)
 
     def test_span_name_for_query_string(self):
         """
         request not have query string
         """
-        Client().get("/span_name/1234/?query=test")
+        self.client.get("/span_name/1234/?query=test")
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 1)
 
         span = span_list[0]
-        self.assertEqual(
-            span.name,
-            "GET ^span_name/([0-9]{4})/$" if DJANGO_2_2 else "GET",
-        )
+        self.assertEqual(span.name, _EXPECTED_SPAN_NAME_ROUTE_NAME)
 
     def test_span_name_404(self):
-        Client().get("/span_name/1234567890/")
+        self.client.get("/span_name/1234567890/")
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 1)
 
@@ -344,7 +422,7 @@ class TestMiddleware(WsgiTestBase):
         self.assertEqual(span.name, "GET")
 
     def test_traced_request_attrs(self):
-        Client().get("/span_name/1234/", CONTENT_TYPE="test/ct")
+        self.client.get("/span_name/1234/", CONTENT_TYPE="test/ct")
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 1)
 
@@ -369,7 +447,7 @@ class TestMiddleware(WsgiTestBase):
         _DjangoMiddleware._otel_request_hook = request_hook
         _DjangoMiddleware._otel_response_hook = response_hook
 
-        response = Client().get("/span_name/1234/")
+        response = self.client.get("/span_name/1234/")
         _DjangoMiddleware._otel_request_hook = (
             _DjangoMiddleware._otel_response_hook
         ) = None
@@ -393,127 +471,117 @@ class TestMiddleware(WsgiTestBase):
         self.assertEqual(response_hook_args[2], response)
 
     def test_trace_parent(self):
-        id_generator = RandomIdGenerator()
-        trace_id = format_trace_id(id_generator.generate_trace_id())
-        span_id = format_span_id(id_generator.generate_span_id())
-        traceparent_value = f"00-{trace_id}-{span_id}-01"
+        trace_id = _ID_GENERATOR.generate_trace_id()
+        span_id = _ID_GENERATOR.generate_span_id()
+        traceparent_value = (
+            f"00-{format_trace_id(trace_id)}-{format_span_id(span_id)}-01"
+        )
 
-        Client().get(
+        self.client.get(
             "/span_name/1234/",
             HTTP_TRACEPARENT=traceparent_value,
         )
         span = self.memory_exporter.get_finished_spans()[0]
+        parent = span.parent
 
-        self.assertEqual(
-            trace_id,
-            format_trace_id(span.get_span_context().trace_id),
-        )
-        self.assertIsNotNone(span.parent)
-        self.assertEqual(
-            trace_id,
-            format_trace_id(span.parent.trace_id),
-        )
-        self.assertEqual(
-            span_id,
-            format_span_id(span.parent.span_id),
-        )
-        self.memory_exporter.clear()
+        # Compare the integer ids, only the header needs the hex format
+        self.assertEqual(trace_id, span.get_span_context().trace_id)
+        self.assertIsNotNone(parent)
+        self.assertEqual(trace_id, parent.trace_id)
+        self.assertEqual(span_id, parent.span_id)
 
     def test_trace_response_headers(self):
-        response = Client().get("/span_name/1234/")
+        response = self.client.get("/span_name/1234/")
 
         self.assertFalse(response.has_header("Server-Timing"))
         self.memory_exporter.clear()
 
         set_global_response_propagator(TraceResponsePropagator())
 
-        response = Client().get("/span_name/1234/")
+        response = self.client.get("/span_name/1234/")
         self.assertTraceResponseHeaderMatchesSpan(
             response,
             self.memory_exporter.get_finished_spans()[0],
         )
-        self.memory_exporter.clear()
 
     def test_uninstrument(self):
-        Client().get("/route/2020/template/")
+        self.client.get("/route/2020/template/")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 1)
 
         self.memory_exporter.clear()
         _django_instrumentor.uninstrument()
+        try:
+            # self.client has already loaded the instrumented middleware chain
+            Client().get("/route/2020/template/")
+            spans = self.memory_exporter.get_finished_spans()
+            self.assertEqual(len(spans), 0)
+        finally:
+            self._instrument()
 
-        Client().get("/route/2020/template/")
-        spans = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(spans), 0)
-
-    # pylint: disable=too-many-locals
     def test_wsgi_metrics(self):
-        _expected_metric_names = [
-            "http.server.active_requests",
-            "http.server.duration",
-        ]
-        _recommended_attrs = {
-            "http.server.active_requests": _active_requests_count_attrs,
-            "http.server.duration": _duration_attrs,
-        }
+        # Build the request environ once so the timed loop only covers the
+        # request round-trips
+        environ = {"REQUEST_METHOD": "GET", "PATH_INFO": "/span_name/1234/"}
         start = default_timer()
         for _ in range(3):
-            response = Client().get("/span_name/1234/")
+            response = self.client.request(**environ)
             self.assertEqual(response.status_code, 200)
         duration = max(round((default_timer() - start) * 1000), 0)
         metrics_list = self.memory_metrics_reader.get_metrics_data()
-        number_data_point_seen = False
-        histrogram_data_point_seen = False
+        data_points = {
+            metric.name: metric.data.data_points
+            for resource_metric in metrics_list.resource_metrics
+            for scope_metric in resource_metric.scope_metrics
+            for metric in scope_metric.metrics
+        }
 
-        self.assertTrue(len(metrics_list.resource_metrics) != 0)
-        for resource_metric in metrics_list.resource_metrics:
-            self.assertTrue(len(resource_metric.scope_metrics) != 0)
-            for scope_metric in resource_metric.scope_metrics:
-                self.assertTrue(len(scope_metric.metrics) != 0)
-                for metric in scope_metric.metrics:
-                    self.assertIn(metric.name, _expected_metric_names)
-                    data_points = list(metric.data.data_points)
-                    self.assertEqual(len(data_points), 1)
-                    for point in data_points:
-                        if isinstance(point, HistogramDataPoint):
-                            self.assertEqual(point.count, 3)
-                            histrogram_data_point_seen = True
-                            self.assertAlmostEqual(
-                                duration, point.sum, delta=100
-                            )
-                        if isinstance(point, NumberDataPoint):
-                            number_data_point_seen = True
-                            self.assertEqual(point.value, 0)
-                        for attr in point.attributes:
-                            self.assertIn(
-                                attr, _recommended_attrs[metric.name]
-                            )
-        self.assertTrue(histrogram_data_point_seen and number_data_point_seen)
+        self.assertEqual(data_points.keys(), _RECOMMENDED_ATTRS.keys())
+        for name, points in data_points.items():
+            self.assertEqual(len(points), 1)
+            self.assertLessEqual(
+                set(points[0].attributes), _RECOMMENDED_ATTRS[name]
+            )
+
+        duration_point = data_points["http.server.duration"][0]
+        self.assertIsInstance(duration_point, HistogramDataPoint)
+        self.assertEqual(duration_point.count, 3)
+        self.assertAlmostEqual(duration, duration_point.sum, delta=100)
+
+        active_requests_point = data_points["http.server.active_requests"][0]
+        self.assertIsInstance(active_requests_point, NumberDataPoint)
+        self.assertEqual(active_requests_point.value, 0)
 
     def test_wsgi_metrics_unistrument(self):
-        Client().get("/span_name/1234/")
+        self.client.get("/span_name/1234/")
         _django_instrumentor.uninstrument()
-        Client().get("/span_name/1234/")
+        try:
+            # self.client has already loaded the instrumented middleware chain
+            Client().get("/span_name/1234/")
+        finally:
+            self._instrument()
+        # Only the request made while instrumented is recorded
+        expected_values = {
+            HistogramDataPoint: ("count", 1),
+            NumberDataPoint: ("value", 0),
+        }
         metrics_list = self.memory_metrics_reader.get_metrics_data()
         for resource_metric in metrics_list.resource_metrics:
             for scope_metric in resource_metric.scope_metrics:
                 for metric in scope_metric.metrics:
-                    for point in list(metric.data.data_points):
-                        if isinstance(point, HistogramDataPoint):
-                            self.assertEqual(1, point.count)
-                        if isinstance(point, NumberDataPoint):
-                            self.assertEqual(0, point.value)
+                    for point in metric.data.data_points:
+                        field, value = expected_values[type(point)]
+                        self.assertEqual(value, getattr(point, field))
 
 
 class TestMiddlewareWithTracerProvider(WsgiTestBase):
     @classmethod
     def setUpClass(cls):
-        conf.settings.configure(ROOT_URLCONF=modules[__name__])
         super().setUpClass()
+        setup_test_environment()
 
     def setUp(self):
         super().setUp()
-        setup_test_environment()
         resource = resources.Resource.create(
             {"resource-key": "resource-value"}
         )
@@ -522,19 +590,19 @@ class TestMiddlewareWithTracerProvider(WsgiTestBase):
         self.exporter = exporter
         self.tracer_provider = tracer_provider
         _django_instrumentor.instrument(tracer_provider=tracer_provider)
+        self.client = Client()
 
     def tearDown(self):
         super().tearDown()
-        teardown_test_environment()
         _django_instrumentor.uninstrument()
 
     @classmethod
     def tearDownClass(cls):
         super().tearDownClass()
-        conf.settings = conf.LazySettings()
+        teardown_test_environment()
 
     def test_tracer_provider_traced(self):
-        Client().post("/traced/")
+        self.client.post("/traced/")
 
         spans = self.exporter.get_finished_spans()
         self.assertEqual(len(spans), 1)
@@ -550,12 +618,10 @@ class TestMiddlewareWithTracerProvider(WsgiTestBase):
         with tracer.start_as_current_span(
             "test", kind=SpanKind.SERVER
         ) as parent_span:
-            Client().get("/span_name/1234/")
+            self.client.get("/span_name/1234/")
             span_list = self.exporter.get_finished_spans()
             print(span_list)
-            self.assertEqual(
-                span_list[0].attributes[SpanAttributes.HTTP_STATUS_CODE], 200
-            )
+            self.assertEqual(span_list[0].attributes[_HTTP_STATUS_CODE], 200)
             self.assertEqual(trace.SpanKind.INTERNAL, span_list[0].kind)
             self.assertEqual(
                 parent_span.get_span_context().span_id,
@@ -563,119 +629,64 @@ class TestMiddlewareWithTracerProvider(WsgiTestBase):
             )
 
 
-@patch.dict(
-    "os.environ",
-    {
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
-    },
-)
 class TestMiddlewareWsgiWithCustomHeaders(WsgiTestBase):
     @classmethod
     def setUpClass(cls):
-        conf.settings.configure(ROOT_URLCONF=modules[__name__])
         super().setUpClass()
-
-    def setUp(self):
-        super().setUp()
         setup_test_environment()
-        tracer_provider, exporter = self.create_tracer_provider()
-        self.exporter = exporter
-        _django_instrumentor.instrument(tracer_provider=tracer_provider)
-
-    def tearDown(self):
-        super().tearDown()
-        teardown_test_environment()
-        _django_instrumentor.uninstrument()
+        cls.tracer_provider, cls.memory_exporter = cls.create_tracer_provider()
+        # Every test asserts on the same request and response spans, so both
+        # requests are issued once for the whole class
+        _django_instrumentor.instrument(tracer_provider=cls.tracer_provider)
+        try:
+            with patch.dict("os.environ", _CUSTOM_HEADERS_ENVIRON):
+                client = Client()
+                client.get(
+                    "/traced/",
+                    HTTP_CUSTOM_TEST_HEADER_1="test-header-value-1",
+                    HTTP_CUSTOM_TEST_HEADER_2="test-header-value-2",
+                    HTTP_REGEX_TEST_HEADER_1="Regex Test Value 1",
+                    HTTP_REGEX_TEST_HEADER_2="RegexTestValue2,RegexTestValue3",
+                    HTTP_MY_SECRET_HEADER="My Secret Value",
+                    # Sent but not configured for capture
+                    HTTP_CUSTOM_TEST_HEADER_4="test-header-value-4",
+                )
+                client.get("/traced_custom_header/")
+        finally:
+            _django_instrumentor.uninstrument()
+        (
+            cls.request_span,
+            cls.response_span,
+        ) = cls.memory_exporter.get_finished_spans()
 
     @classmethod
     def tearDownClass(cls):
         super().tearDownClass()
-        conf.settings = conf.LazySettings()
-
-    def test_http_custom_request_headers_in_span_attributes(self):
-        expected = {
-            "http.request.header.custom_test_header_1": (
-                "test-header-value-1",
-            ),
-            "http.request.header.custom_test_header_2": (
-                "test-header-value-2",
-            ),
-            "http.request.header.regex_test_header_1": ("Regex Test Value 1",),
-            "http.request.header.regex_test_header_2": (
-                "RegexTestValue2,RegexTestValue3",
-            ),
-            "http.request.header.my_secret_header": ("[REDACTED]",),
-        }
-        Client(
-            HTTP_CUSTOM_TEST_HEADER_1="test-header-value-1",
-            HTTP_CUSTOM_TEST_HEADER_2="test-header-value-2",
-            HTTP_REGEX_TEST_HEADER_1="Regex Test Value 1",
-            HTTP_REGEX_TEST_HEADER_2="RegexTestValue2,RegexTestValue3",
-            HTTP_MY_SECRET_HEADER="My Secret Value",
-        ).get("/traced/")
-        spans = self.exporter.get_finished_spans()
-        self.assertEqual(len(spans), 1)
-
-        span = spans[0]
-        self.assertEqual(span.kind, SpanKind.SERVER)
-        self.assertSpanHasAttributes(span, expected)
-        self.memory_exporter.clear()
-
-    def test_http_custom_request_headers_not_in_span_attributes(self):
-        not_expected = {
-            "http.request.header.custom_test_header_2": (
-                "test-header-value-2",
-            ),
-        }
-        Client(HTTP_CUSTOM_TEST_HEADER_1="test-header-value-1").get("/traced/")
-        spans = self.exporter.get_finished_spans()
-        self.assertEqual(len(spans), 1)
-
-        span = spans[0]
-        self.assertEqual(span.kind, SpanKind.SERVER)
-        for key, _ in not_expected.items():
-            self.assertNotIn(key, span.attributes)
-        self.memory_exporter.clear()
+        teardown_test_environment()
 
-    def test_http_custom_response_headers_in_span_attributes(self):
-        expected = {
-            "http.response.header.custom_test_header_1": (
-                "test-header-value-1",
-            ),
-            "http.response.header.custom_test_header_2": (
-                "test-header-value-2",
-            ),
-            "http.response.header.my_custom_regex_header_1": (
-                "my-custom-regex-value-1,my-custom-regex-value-2",
-            ),
-            "http.response.header.my_custom_regex_header_2": (
-                "my-custom-regex-value-3,my-custom-regex-value-4",
-            ),
-            "http.response.header.my_secret_header": ("[REDACTED]",),
-        }
-        Client().get("/traced_custom_header/")
-        spans = self.exporter.get_finished_spans()
-        self.assertEqual(len(spans), 1)
+    def test_http_custom_headers(self):
+        with self.subTest(name="request headers in span attributes"):
+            self.assertEqual(self.request_span.kind, SpanKind.SERVER)
+            self.assertSpanHasAttributes(
+                self.request_span, _EXPECTED_REQUEST_HEADERS
+            )
 
-        span = spans[0]
-        self.assertEqual(span.kind, SpanKind.SERVER)
-        self.assertSpanHasAttributes(span, expected)
-        self.memory_exporter.clear()
+        with self.subTest(name="request headers not in span attributes"):
+            # Custom-Test-Header-4 is sent but not configured for capture
+            self.assertNotIn(
+                "http.request.header.custom_test_header_4",
+                self.request_span.attributes,
+            )
 
-    def test_http_custom_response_headers_not_in_span_attributes(self):
-        not_expected = {
-            "http.response.header.custom_test_header_3": (
-                "test-header-value-3",
-            ),
-        }
-        Client().get("/traced_custom_header/")
-        spans = self.exporter.get_finished_spans()
-        self.assertEqual(len(spans), 1)
+        with self.subTest(name="response headers in span attributes"):
+            self.assertEqual(self.response_span.kind, SpanKind.SERVER)
+            self.assertSpanHasAttributes(
+                self.response_span, _EXPECTED_RESPONSE_HEADERS
+            )
 
-        span = spans[0]
-        self.assertEqual(span.kind, SpanKind.SERVER)
-        for key, _ in not_expected.items():
-            self.assertNotIn(key, span.attributes)
-        self.memory_exporter.clear()
+        with self.subTest(name="response headers not in span attributes"):
+            # Custom-Test-Header-3 is configured for capture but not returned
+            self.assertNotIn(
+                "http.response.header.custom_test_header_3",
+                self.response_span.attributes,
+            )
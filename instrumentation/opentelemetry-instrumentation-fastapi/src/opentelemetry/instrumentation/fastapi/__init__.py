@@ -248,6 +248,9 @@ class FastAPIInstrumentor(BaseInstrumentor):
 
     @staticmethod
     def uninstrument_app(app: fastapi.FastAPI):
+        if getattr(app, "_is_instrumented_by_opentelemetry", None) is False:
+            # Already uninstrumented, keep the current middleware stack.
+            return
         app.user_middleware = [
             x
             for x in app.user_middleware
@@ -47,64 +47,138 @@ _expected_metric_names = [
     "http.server.response.size",
     "http.server.request.size",
 ]
+_server_attrs = frozenset((*_duration_attrs, SpanAttributes.HTTP_TARGET))
 _recommended_attrs = {
-    "http.server.active_requests": _active_requests_count_attrs,
-    "http.server.duration": {*_duration_attrs, SpanAttributes.HTTP_TARGET},
-    "http.server.response.size": {
-        *_duration_attrs,
-        SpanAttributes.HTTP_TARGET,
-    },
-    "http.server.request.size": {
-        *_duration_attrs,
-        SpanAttributes.HTTP_TARGET,
-    },
+    "http.server.active_requests": frozenset(_active_requests_count_attrs),
+    "http.server.duration": _server_attrs,
+    "http.server.response.size": _server_attrs,
+    "http.server.request.size": _server_attrs,
+}
+_INSTRUMENTOR = otel_fastapi.FastAPIInstrumentor()
+_EXCLUDED_URLS = "/exclude/123,healthzz"
+# the metric tests assert on the https scheme and port 443
+_HTTPS_BASE_URL = "https://testserver"
+_CUSTOM_HEADERS_ENVIRON = {
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
 }
 
 
+def _server_span(spans):
+    return next(span for span in spans if span.kind is trace.SpanKind.SERVER)
+
+
+def _routes(kind):
+    """Build a fresh set of routes for ``kind``."""
+    router = fastapi.APIRouter()
+
+    if kind == "basic":
+
+        @router.get("/foobar")
+        async def _():
+            return {"message": "hello world"}
+
+        @router.get("/user/{username}")
+        async def _(username: str):
+            return {"message": username}
+
+        @router.get("/exclude/{param}")
+        async def _(param: str):
+            return {"message": param}
+
+        @router.get("/healthzz")
+        async def _():
+            return {"message": "ok"}
+
+    elif kind == "custom_headers":
+
+        @router.get("/foobar")
+        async def _():
+            headers = {
+                "custom-test-header-1": "test-header-value-1",
+                "custom-test-header-2": "test-header-value-2",
+                "my-custom-regex-header-1": "my-custom-regex-value-1,my-custom-regex-value-2",
+                "My-Custom-Regex-Header-2": "my-custom-regex-value-3,my-custom-regex-value-4",
+                "My-Secret-Header": "My Secret Value",
+            }
+            content = {"message": "hello world"}
+            return JSONResponse(content=content, headers=headers)
+
+    elif kind == "websocket":
+
+        @router.websocket("/foobar_web")
+        async def _(websocket: fastapi.WebSocket):
+            message = await websocket.receive()
+            if message.get("type") == "websocket.connect":
+                await websocket.send(
+                    {
+                        "type": "websocket.accept",
+                        "headers": [
+                            (b"custom-test-header-1", b"test-header-value-1"),
+                            (b"custom-test-header-2", b"test-header-value-2"),
+                            (b"Regex-Test-Header-1", b"Regex Test Value 1"),
+                            (
+                                b"regex-test-header-2",
+                                b"RegexTestValue2,RegexTestValue3",
+                            ),
+                            (b"My-Secret-Header", b"My Secret Value"),
+                        ],
+                    }
+                )
+                await websocket.send_json({"message": "hello world"})
+                await websocket.close()
+            if message.get("type") == "websocket.disconnect":
+                pass
+
+    else:
+        raise ValueError(f"unknown app kind: {kind}")
+
+    return tuple(router.routes)
+
+
+def _build_app(kind="basic"):
+    # look FastAPI up at call time so auto-instrumentation applies
+    app = fastapi.FastAPI()
+    app.router.routes.extend(_routes(kind))
+    return app
+
+
 class TestFastAPIManualInstrumentation(TestBase):
+    _instrumentor = _INSTRUMENTOR
+    server_request_hook = None
+    client_request_hook = None
+    client_response_hook = None
+
     def _create_app(self):
         app = self._create_fastapi_app()
         self._instrumentor.instrument_app(
             app=app,
-            server_request_hook=getattr(self, "server_request_hook", None),
-            client_request_hook=getattr(self, "client_request_hook", None),
-            client_response_hook=getattr(self, "client_response_hook", None),
+            excluded_urls=_EXCLUDED_URLS,
+            server_request_hook=self.server_request_hook,
+            client_request_hook=self.client_request_hook,
+            client_response_hook=self.client_response_hook,
         )
         return app
 
-    def _create_app_explicit_excluded_urls(self):
+    def _create_app_with_excluded_urls(self, to_exclude):
         app = self._create_fastapi_app()
-        to_exclude = "/user/123,/foobar"
         self._instrumentor.instrument_app(
             app,
             excluded_urls=to_exclude,
-            server_request_hook=getattr(self, "server_request_hook", None),
-            client_request_hook=getattr(self, "client_request_hook", None),
-            client_response_hook=getattr(self, "client_response_hook", None),
+            server_request_hook=self.server_request_hook,
+            client_request_hook=self.client_request_hook,
+            client_response_hook=self.client_response_hook,
         )
         return app
 
     def setUp(self):
         super().setUp()
-        self.env_patch = patch.dict(
-            "os.environ",
-            {"OTEL_PYTHON_FASTAPI_EXCLUDED_URLS": "/exclude/123,healthzz"},
-        )
-        self.env_patch.start()
-        self.exclude_patch = patch(
-            "opentelemetry.instrumentation.fastapi._excluded_urls_from_env",
-            get_excluded_urls("FASTAPI"),
-        )
-        self.exclude_patch.start()
-        self._instrumentor = otel_fastapi.FastAPIInstrumentor()
         self._app = self._create_app()
-        self._app.add_middleware(HTTPSRedirectMiddleware)
-        self._client = TestClient(self._app)
+        self._client = TestClient(self._app, base_url=_HTTPS_BASE_URL)
 
     def tearDown(self):
         super().tearDown()
-        self.env_patch.stop()
-        self.exclude_patch.stop()
         with self.disable_logging():
             self._instrumentor.uninstrument()
             self._instrumentor.uninstrument_app(self._app)
@@ -125,16 +199,22 @@ class TestFastAPIManualInstrumentation(TestBase):
 
         self._instrumentor.uninstrument_app(self._app)
         self.assertFalse(
-            isinstance(
-                self._app.user_middleware[0].cls, OpenTelemetryMiddleware
+            any(
+                middleware.cls is OpenTelemetryMiddleware
+                for middleware in self._app.user_middleware
             )
         )
-        self._client = TestClient(self._app)
         resp = self._client.get("/foobar")
         self.assertEqual(200, resp.status_code)
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
+    def test_uninstrument_app_twice(self):
+        self._instrumentor.uninstrument_app(self._app)
+        middleware_stack = self._app.middleware_stack
+        self._instrumentor.uninstrument_app(self._app)
+        self.assertIs(self._app.middleware_stack, middleware_stack)
+
     def test_uninstrument_app_after_instrument(self):
         if not isinstance(self, TestAutoInstrumentation):
             self._instrumentor.instrument()
@@ -157,28 +237,35 @@ class TestFastAPIManualInstrumentation(TestBase):
         self.assertEqual(len(spans), 3)
         for span in spans:
             self.assertIn("GET /user/{username}", span.name)
+        server_attributes = spans[-1].attributes
         self.assertEqual(
-            spans[-1].attributes[SpanAttributes.HTTP_ROUTE], "/user/{username}"
+            server_attributes[SpanAttributes.HTTP_ROUTE], "/user/{username}"
         )
         # ensure that at least one attribute that is populated by
         # the asgi instrumentation is successfully feeding though.
-        self.assertEqual(
-            spans[-1].attributes[SpanAttributes.HTTP_FLAVOR], "1.1"
-        )
+        self.assertEqual(server_attributes[SpanAttributes.HTTP_FLAVOR], "1.1")
 
     def test_fastapi_excluded_urls(self):
         """Ensure that given fastapi routes are excluded."""
-        self._client.get("/exclude/123")
+        with patch.dict(
+            "os.environ", {"OTEL_PYTHON_FASTAPI_EXCLUDED_URLS": _EXCLUDED_URLS}
+        ), patch(
+            "opentelemetry.instrumentation.fastapi._excluded_urls_from_env",
+            get_excluded_urls("FASTAPI"),
+        ):
+            app = self._create_app_with_excluded_urls(None)
+        client = TestClient(app, base_url=_HTTPS_BASE_URL)
+        client.get("/exclude/123")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
-        self._client.get("/healthzz")
+        client.get("/healthzz")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
 
     def test_fastapi_excluded_urls_not_env(self):
         """Ensure that given fastapi routes are excluded when passed explicitly (not in the environment)"""
-        app = self._create_app_explicit_excluded_urls()
-        client = TestClient(app)
+        app = self._create_app_with_excluded_urls("/user/123,/foobar")
+        client = TestClient(app, base_url=_HTTPS_BASE_URL)
         client.get("/user/123")
         spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans), 0)
@@ -187,36 +274,36 @@ class TestFastAPIManualInstrumentation(TestBase):
         self.assertEqual(len(spans), 0)
 
     def test_fastapi_metrics(self):
-        self._client.get("/foobar")
-        self._client.get("/foobar")
-        self._client.get("/foobar")
+        for _ in range(3):
+            self._client.get("/foobar")
         metrics_list = self.memory_metrics_reader.get_metrics_data()
         number_data_point_seen = False
         histogram_data_point_seen = False
-        self.assertTrue(len(metrics_list.resource_metrics) == 1)
-        for resource_metric in metrics_list.resource_metrics:
-            self.assertTrue(len(resource_metric.scope_metrics) == 1)
-            for scope_metric in resource_metric.scope_metrics:
-                self.assertTrue(len(scope_metric.metrics) == 3)
-                for metric in scope_metric.metrics:
-                    self.assertIn(metric.name, _expected_metric_names)
-                    data_points = list(metric.data.data_points)
-                    self.assertEqual(len(data_points), 1)
-                    for point in data_points:
-                        if isinstance(point, HistogramDataPoint):
-                            self.assertEqual(point.count, 3)
-                            histogram_data_point_seen = True
-                        if isinstance(point, NumberDataPoint):
-                            number_data_point_seen = True
-                        for attr in point.attributes:
-                            self.assertIn(
-                                attr, _recommended_attrs[metric.name]
-                            )
+        self.assertEqual(len(metrics_list.resource_metrics), 1)
+        scope_metrics = metrics_list.resource_metrics[0].scope_metrics
+        self.assertEqual(len(scope_metrics), 1)
+        metrics = scope_metrics[0].metrics
+        self.assertEqual(len(metrics), 3)
+        for metric in metrics:
+            self.assertIn(metric.name, _expected_metric_names)
+            allowed = _recommended_attrs[metric.name]
+            data_points = metric.data.data_points
+            self.assertEqual(len(data_points), 1)
+            for point in data_points:
+                if isinstance(point, HistogramDataPoint):
+                    self.assertEqual(point.count, 3)
+                    histogram_data_point_seen = True
+                if isinstance(point, NumberDataPoint):
+                    number_data_point_seen = True
+                self.assertLessEqual(point.attributes.keys(), allowed)
         self.assertTrue(number_data_point_seen and histogram_data_point_seen)
 
     def test_basic_metric_success(self):
+        # the plain http request is redirected to https before it reaches
+        # the OpenTelemetry middleware, so only the https request is recorded
+        self._app.add_middleware(HTTPSRedirectMiddleware)
         start = default_timer()
-        self._client.get("/foobar")
+        response = TestClient(self._app).get("/foobar")
         duration = max(round((default_timer() - start) * 1000), 0)
         expected_duration_attributes = {
             "http.method": "GET",
@@ -228,6 +315,10 @@ class TestFastAPIManualInstrumentation(TestBase):
             "http.status_code": 200,
             "http.target": "/foobar",
         }
+        self.assertEqual(200, response.status_code)
+        self.assertEqual(
+            [307], [redirect.status_code for redirect in response.history]
+        )
         expected_requests_count_attributes = {
             "http.method": "GET",
             "http.host": "testserver:443",
@@ -239,18 +330,18 @@ class TestFastAPIManualInstrumentation(TestBase):
         for metric in (
             metrics_list.resource_metrics[0].scope_metrics[0].metrics
         ):
-            for point in list(metric.data.data_points):
+            for point in metric.data.data_points:
                 if isinstance(point, HistogramDataPoint):
-                    self.assertDictEqual(
-                        expected_duration_attributes,
-                        dict(point.attributes),
+                    self.assertEqual(
+                        expected_duration_attributes.items(),
+                        point.attributes.items(),
                     )
                     self.assertEqual(point.count, 1)
                     self.assertAlmostEqual(duration, point.sum, delta=30)
                 if isinstance(point, NumberDataPoint):
-                    self.assertDictEqual(
-                        expected_requests_count_attributes,
-                        dict(point.attributes),
+                    self.assertEqual(
+                        expected_requests_count_attributes.items(),
+                        point.attributes.items(),
                     )
                     self.assertEqual(point.value, 0)
 
@@ -263,19 +354,23 @@ class TestFastAPIManualInstrumentation(TestBase):
         duration = max(round((default_timer() - start) * 1000), 0)
         response_size = int(response.headers.get("content-length"))
         request_size = int(response.request.headers.get("content-length"))
+        # histogram name -> (expected sum, allowed delta)
+        expected_sums = {
+            "http.server.duration": (duration, 30),
+            "http.server.response.size": (response_size, 0),
+            "http.server.request.size": (request_size, 0),
+        }
         metrics_list = self.memory_metrics_reader.get_metrics_data()
         for metric in (
             metrics_list.resource_metrics[0].scope_metrics[0].metrics
         ):
-            for point in list(metric.data.data_points):
+            for point in metric.data.data_points:
                 if isinstance(point, HistogramDataPoint):
                     self.assertEqual(point.count, 1)
-                    if metric.name == "http.server.duration":
-                        self.assertAlmostEqual(duration, point.sum, delta=30)
-                    elif metric.name == "http.server.response.size":
-                        self.assertEqual(response_size, point.sum)
-                    elif metric.name == "http.server.request.size":
-                        self.assertEqual(request_size, point.sum)
+                    expected_sum, delta = expected_sums[metric.name]
+                    self.assertAlmostEqual(
+                        expected_sum, point.sum, delta=delta
+                    )
                 if isinstance(point, NumberDataPoint):
                     self.assertEqual(point.value, 0)
 
@@ -287,7 +382,7 @@ class TestFastAPIManualInstrumentation(TestBase):
         for metric in (
             metrics_list.resource_metrics[0].scope_metrics[0].metrics
         ):
-            for point in list(metric.data.data_points):
+            for point in metric.data.data_points:
                 if isinstance(point, HistogramDataPoint):
                     self.assertEqual(point.count, 1)
                 if isinstance(point, NumberDataPoint):
@@ -304,7 +399,7 @@ class TestFastAPIManualInstrumentation(TestBase):
         for metric in (
             metrics_list.resource_metrics[0].scope_metrics[0].metrics
         ):
-            for point in list(metric.data.data_points):
+            for point in metric.data.data_points:
                 if isinstance(point, HistogramDataPoint):
                     self.assertEqual(point.count, 1)
                 if isinstance(point, NumberDataPoint):
@@ -312,25 +407,7 @@ class TestFastAPIManualInstrumentation(TestBase):
 
     @staticmethod
     def _create_fastapi_app():
-        app = fastapi.FastAPI()
-
-        @app.get("/foobar")
-        async def _():
-            return {"message": "hello world"}
-
-        @app.get("/user/{username}")
-        async def _(username: str):
-            return {"message": username}
-
-        @app.get("/exclude/{param}")
-        async def _(param: str):
-            return {"message": param}
-
-        @app.get("/healthzz")
-        async def _():
-            return {"message": "ok"}
-
-        return app
+        return _build_app()
 
 
 class TestFastAPIManualInstrumentationHooks(TestFastAPIManualInstrumentation):
@@ -367,15 +444,15 @@ class TestFastAPIManualInstrumentationHooks(TestFastAPIManualInstrumentation):
         self._client_response_hook = client_response_hook
 
         self._client.get("/foobar")
-        spans = self.sorted_spans(self.memory_exporter.get_finished_spans())
+        # spans are exported as they end, so the server span comes last
+        spans = self.memory_exporter.get_finished_spans()
         self.assertEqual(
             len(spans), 3
         )  # 1 server span and 2 response spans (response start and body)
 
-        server_span = spans[2]
+        *response_spans, server_span = spans
         self.assertEqual(server_span.name, "name from server hook")
 
-        response_spans = spans[:2]
         for span in response_spans:
             self.assertEqual(span.name, "name from response hook")
             self.assertSpanHasAttributes(
@@ -390,27 +467,28 @@ class TestAutoInstrumentation(TestFastAPIManualInstrumentation):
     to both.
     """
 
-    def _create_app(self):
-        # instrumentation is handled by the instrument call
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
         resource = Resource.create({"key1": "value1", "key2": "value2"})
-        result = self.create_tracer_provider(resource=resource)
-        tracer_provider, exporter = result
-        self.memory_exporter = exporter
-
-        self._instrumentor.instrument(tracer_provider=tracer_provider)
-        return self._create_fastapi_app()
+        (
+            cls._resource_tracer_provider,
+            cls._resource_exporter,
+        ) = cls.create_tracer_provider(resource=resource)
 
-    def _create_app_explicit_excluded_urls(self):
-        resource = Resource.create({"key1": "value1", "key2": "value2"})
-        tracer_provider, exporter = self.create_tracer_provider(
-            resource=resource
+    def _create_app(self):
+        # instrumentation is handled by the instrument call
+        self.memory_exporter = self._resource_exporter
+        self._instrumentor.instrument(
+            tracer_provider=self._resource_tracer_provider,
+            excluded_urls=_EXCLUDED_URLS,
         )
-        self.memory_exporter = exporter
+        return self._create_fastapi_app()
 
-        to_exclude = "/user/123,/foobar"
+    def _create_app_with_excluded_urls(self, to_exclude):
         self._instrumentor.uninstrument()  # Disable previous instrumentation (setUp)
         self._instrumentor.instrument(
-            tracer_provider=tracer_provider,
+            tracer_provider=self._resource_tracer_provider,
             excluded_urls=to_exclude,
         )
         return self._create_fastapi_app()
@@ -433,7 +511,7 @@ class TestAutoInstrumentation(TestFastAPIManualInstrumentation):
 
     def test_uninstrument_after_instrument(self):
         app = self._create_fastapi_app()
-        client = TestClient(app)
+        client = TestClient(app, base_url=_HTTPS_BASE_URL)
         client.get("/foobar")
         self._instrumentor.uninstrument()
         client.get("/foobar")
@@ -443,6 +521,7 @@ class TestAutoInstrumentation(TestFastAPIManualInstrumentation):
     def tearDown(self):
         self._instrumentor.uninstrument()
         super().tearDown()
+        self._resource_exporter.clear()
 
 
 class TestAutoInstrumentationHooks(TestFastAPIManualInstrumentationHooks):
@@ -456,28 +535,28 @@ class TestAutoInstrumentationHooks(TestFastAPIManualInstrumentationHooks):
     def _create_app(self):
         # instrumentation is handled by the instrument call
         self._instrumentor.instrument(
-            server_request_hook=getattr(self, "server_request_hook", None),
-            client_request_hook=getattr(self, "client_request_hook", None),
-            client_response_hook=getattr(self, "client_response_hook", None),
+            excluded_urls=_EXCLUDED_URLS,
+            server_request_hook=self.server_request_hook,
+            client_request_hook=self.client_request_hook,
+            client_response_hook=self.client_response_hook,
         )
 
         return self._create_fastapi_app()
 
-    def _create_app_explicit_excluded_urls(self):
+    def _create_app_with_excluded_urls(self, to_exclude):
         resource = Resource.create({"key1": "value1", "key2": "value2"})
         tracer_provider, exporter = self.create_tracer_provider(
             resource=resource
         )
         self.memory_exporter = exporter
 
-        to_exclude = "/user/123,/foobar"
         self._instrumentor.uninstrument()  # Disable previous instrumentation (setUp)
         self._instrumentor.instrument(
             tracer_provider=tracer_provider,
             excluded_urls=to_exclude,
-            server_request_hook=getattr(self, "server_request_hook", None),
-            client_request_hook=getattr(self, "client_request_hook", None),
-            client_response_hook=getattr(self, "client_response_hook", None),
+            server_request_hook=self.server_request_hook,
+            client_request_hook=self.client_request_hook,
+            client_response_hook=self.client_response_hook,
         )
         return self._create_fastapi_app()
 
@@ -491,14 +570,13 @@ class TestAutoInstrumentationLogic(unittest.TestCase):
         """Verify that instrumentation methods are instrumenting and
         removing as expected.
         """
-        instrumentor = otel_fastapi.FastAPIInstrumentor()
         original = fastapi.FastAPI
-        instrumentor.instrument()
+        _INSTRUMENTOR.instrument()
         try:
             instrumented = fastapi.FastAPI
             self.assertIsNot(original, instrumented)
         finally:
-            instrumentor.uninstrument()
+            _INSTRUMENTOR.uninstrument()
 
         should_be_original = fastapi.FastAPI
         self.assertIs(original, should_be_original)
@@ -508,20 +586,14 @@ class TestWrappedApplication(TestBase):
     def setUp(self):
         super().setUp()
 
-        self.app = fastapi.FastAPI()
-
-        @self.app.get("/foobar")
-        async def _():
-            return {"message": "hello world"}
-
-        otel_fastapi.FastAPIInstrumentor().instrument_app(self.app)
+        self.app = _build_app()
+        _INSTRUMENTOR.instrument_app(self.app)
         self.client = TestClient(self.app)
         self.tracer = self.tracer_provider.get_tracer(__name__)
 
     def tearDown(self) -> None:
         super().tearDown()
-        with self.disable_logging():
-            otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
+        _INSTRUMENTOR.uninstrument_app(self.app)
 
     def test_mark_span_internal_in_presence_of_span_from_other_framework(self):
         with self.tracer.start_as_current_span(
@@ -531,8 +603,6 @@ class TestWrappedApplication(TestBase):
             self.assertEqual(200, resp.status_code)
 
         span_list = self.memory_exporter.get_finished_spans()
-        for span in span_list:
-            print(str(span.__class__) + ": " + str(span.__dict__))
 
         # there should be 4 spans - single SERVER "test" and three INTERNAL "FastAPI"
         self.assertEqual(trace.SpanKind.INTERNAL, span_list[0].kind)
@@ -549,199 +619,125 @@ class TestWrappedApplication(TestBase):
         )
 
 
-@patch.dict(
-    "os.environ",
-    {
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
-    },
-)
 class TestHTTPAppWithCustomHeaders(TestBase):
-    def setUp(self):
-        super().setUp()
-        self.app = self._create_app()
-        otel_fastapi.FastAPIInstrumentor().instrument_app(self.app)
-        self.client = TestClient(self.app)
-
-    def tearDown(self) -> None:
-        super().tearDown()
-        with self.disable_logging():
-            otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls.tracer_provider, cls.memory_exporter = cls.create_tracer_provider()
+        # every test asserts on the same server span, so the request is
+        # issued once for the whole class. The environment is patched across
+        # app construction and instrumentation as well, so the test does not
+        # depend on when the middleware reads the capture-header settings.
+        with patch.dict("os.environ", _CUSTOM_HEADERS_ENVIRON):
+            app = cls._create_app()
+            _INSTRUMENTOR.instrument_app(
+                app, tracer_provider=cls.tracer_provider
+            )
+            try:
+                cls.response = TestClient(app).get(
+                    "/foobar",
+                    headers={
+                        "custom-test-header-1": "test-header-value-1",
+                        "custom-test-header-2": "test-header-value-2",
+                        "Regex-Test-Header-1": "Regex Test Value 1",
+                        "regex-test-header-2": "RegexTestValue2,RegexTestValue3",
+                        "My-Secret-Header": "My Secret Value",
+                    },
+                )
+            finally:
+                _INSTRUMENTOR.uninstrument_app(app)
+        cls.span_list = cls.memory_exporter.get_finished_spans()
 
     @staticmethod
     def _create_app():
-        app = fastapi.FastAPI()
+        return _build_app("custom_headers")
 
-        @app.get("/foobar")
-        async def _():
-            headers = {
-                "custom-test-header-1": "test-header-value-1",
-                "custom-test-header-2": "test-header-value-2",
-                "my-custom-regex-header-1": "my-custom-regex-value-1,my-custom-regex-value-2",
-                "My-Custom-Regex-Header-2": "my-custom-regex-value-3,my-custom-regex-value-4",
-                "My-Secret-Header": "My Secret Value",
-            }
-            content = {"message": "hello world"}
-            return JSONResponse(content=content, headers=headers)
-
-        return app
+    def test_http_custom_headers(self):
+        self.assertEqual(200, self.response.status_code)
+        self.assertEqual(len(self.span_list), 3)
+        server_span = _server_span(self.span_list)
 
-    def test_http_custom_request_headers_in_span_attributes(self):
-        expected = {
-            "http.request.header.custom_test_header_1": (
-                "test-header-value-1",
-            ),
-            "http.request.header.custom_test_header_2": (
-                "test-header-value-2",
-            ),
-            "http.request.header.regex_test_header_1": ("Regex Test Value 1",),
-            "http.request.header.regex_test_header_2": (
-                "RegexTestValue2,RegexTestValue3",
-            ),
-            "http.request.header.my_secret_header": ("[REDACTED]",),
-        }
-        resp = self.client.get(
-            "/foobar",
-            headers={
-                "custom-test-header-1": "test-header-value-1",
-                "custom-test-header-2": "test-header-value-2",
-                "Regex-Test-Header-1": "Regex Test Value 1",
-                "regex-test-header-2": "RegexTestValue2,RegexTestValue3",
-                "My-Secret-Header": "My Secret Value",
-            },
-        )
-        self.assertEqual(200, resp.status_code)
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 3)
-
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
-
-        self.assertSpanHasAttributes(server_span, expected)
-
-    def test_http_custom_request_headers_not_in_span_attributes(self):
-        not_expected = {
-            "http.request.header.custom_test_header_3": (
-                "test-header-value-3",
-            ),
-        }
-        resp = self.client.get(
-            "/foobar",
-            headers={
-                "custom-test-header-1": "test-header-value-1",
-                "custom-test-header-2": "test-header-value-2",
-                "Regex-Test-Header-1": "Regex Test Value 1",
-                "regex-test-header-2": "RegexTestValue2,RegexTestValue3",
-                "My-Secret-Header": "My Secret Value",
-            },
-        )
-        self.assertEqual(200, resp.status_code)
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 3)
-
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
-
-        for key, _ in not_expected.items():
-            self.assertNotIn(key, server_span.attributes)
-
-    def test_http_custom_response_headers_in_span_attributes(self):
-        expected = {
-            "http.response.header.custom_test_header_1": (
-                "test-header-value-1",
-            ),
-            "http.response.header.custom_test_header_2": (
-                "test-header-value-2",
-            ),
-            "http.response.header.my_custom_regex_header_1": (
-                "my-custom-regex-value-1,my-custom-regex-value-2",
-            ),
-            "http.response.header.my_custom_regex_header_2": (
-                "my-custom-regex-value-3,my-custom-regex-value-4",
-            ),
-            "http.response.header.my_secret_header": ("[REDACTED]",),
-        }
-        resp = self.client.get("/foobar")
-        self.assertEqual(200, resp.status_code)
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 3)
-
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
-        self.assertSpanHasAttributes(server_span, expected)
+        with self.subTest(name="request headers in span attributes"):
+            self.assertSpanHasAttributes(
+                server_span,
+                {
+                    "http.request.header.custom_test_header_1": (
+                        "test-header-value-1",
+                    ),
+                    "http.request.header.custom_test_header_2": (
+                        "test-header-value-2",
+                    ),
+                    "http.request.header.regex_test_header_1": (
+                        "Regex Test Value 1",
+                    ),
+                    "http.request.header.regex_test_header_2": (
+                        "RegexTestValue2,RegexTestValue3",
+                    ),
+                    "http.request.header.my_secret_header": ("[REDACTED]",),
+                },
+            )
 
-    def test_http_custom_response_headers_not_in_span_attributes(self):
-        not_expected = {
-            "http.response.header.custom_test_header_3": (
-                "test-header-value-3",
-            ),
-        }
-        resp = self.client.get("/foobar")
-        self.assertEqual(200, resp.status_code)
-        span_list = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(span_list), 3)
+        with self.subTest(name="request headers not in span attributes"):
+            # Custom-Test-Header-3 is configured for capture but not sent
+            self.assertNotIn(
+                "http.request.header.custom_test_header_3",
+                server_span.attributes,
+            )
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        with self.subTest(name="response headers in span attributes"):
+            self.assertSpanHasAttributes(
+                server_span,
+                {
+                    "http.response.header.custom_test_header_1": (
+                        "test-header-value-1",
+                    ),
+                    "http.response.header.custom_test_header_2": (
+                        "test-header-value-2",
+                    ),
+                    "http.response.header.my_custom_regex_header_1": (
+                        "my-custom-regex-value-1,my-custom-regex-value-2",
+                    ),
+                    "http.response.header.my_custom_regex_header_2": (
+                        "my-custom-regex-value-3,my-custom-regex-value-4",
+                    ),
+                    "http.response.header.my_secret_header": ("[REDACTED]",),
+                },
+            )
 
-        for key, _ in not_expected.items():
-            self.assertNotIn(key, server_span.attributes)
+        with self.subTest(name="response headers not in span attributes"):
+            # Custom-Test-Header-3 is configured for capture but not returned
+            self.assertNotIn(
+                "http.response.header.custom_test_header_3",
+                server_span.attributes,
+            )
 
 
-@patch.dict(
-    "os.environ",
-    {
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
-    },
-)
 class TestWebSocketAppWithCustomHeaders(TestBase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        # patch once for the whole class rather than around every test
+        cls._env_patch = patch.dict("os.environ", _CUSTOM_HEADERS_ENVIRON)
+        cls._env_patch.start()
+
+    @classmethod
+    def tearDownClass(cls):
+        cls._env_patch.stop()
+        super().tearDownClass()
+
     def setUp(self):
         super().setUp()
         self.app = self._create_app()
-        otel_fastapi.FastAPIInstrumentor().instrument_app(self.app)
+        _INSTRUMENTOR.instrument_app(self.app)
         self.client = TestClient(self.app)
 
     def tearDown(self) -> None:
         super().tearDown()
-        with self.disable_logging():
-            otel_fastapi.FastAPIInstrumentor().uninstrument_app(self.app)
+        _INSTRUMENTOR.uninstrument_app(self.app)
 
     @staticmethod
     def _create_app():
-        app = fastapi.FastAPI()
-
-        @app.websocket("/foobar_web")
-        async def _(websocket: fastapi.WebSocket):
-            message = await websocket.receive()
-            if message.get("type") == "websocket.connect":
-                await websocket.send(
-                    {
-                        "type": "websocket.accept",
-                        "headers": [
-                            (b"custom-test-header-1", b"test-header-value-1"),
-                            (b"custom-test-header-2", b"test-header-value-2"),
-                            (b"Regex-Test-Header-1", b"Regex Test Value 1"),
-                            (
-                                b"regex-test-header-2",
-                                b"RegexTestValue2,RegexTestValue3",
-                            ),
-                            (b"My-Secret-Header", b"My Secret Value"),
-                        ],
-                    }
-                )
-                await websocket.send_json({"message": "hello world"})
-                await websocket.close()
-            if message.get("type") == "websocket.disconnect":
-                pass
-
-        return app
+        return _build_app("websocket")
 
     def test_web_socket_custom_request_headers_in_span_attributes(self):
         expected = {
@@ -766,19 +762,10 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         self.assertSpanHasAttributes(server_span, expected)
 
-    @patch.dict(
-        "os.environ",
-        {
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
-        },
-    )
     def test_web_socket_custom_request_headers_not_in_span_attributes(self):
         not_expected = {
             "http.request.header.custom_test_header_3": (
@@ -799,9 +786,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         for key, _ in not_expected.items():
             self.assertNotIn(key, server_span.attributes)
@@ -823,9 +808,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         self.assertSpanHasAttributes(server_span, expected)
 
@@ -843,9 +826,7 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == trace.SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         for key, _ in not_expected.items():
             self.assertNotIn(key, server_span.attributes)
@@ -860,24 +841,18 @@ class TestWebSocketAppWithCustomHeaders(TestBase):
 class TestNonRecordingSpanWithCustomHeaders(TestBase):
     def setUp(self):
         super().setUp()
-        self.app = fastapi.FastAPI()
-
-        @self.app.get("/foobar")
-        async def _():
-            return {"message": "hello world"}
+        self.app = _build_app()
 
         reset_trace_globals()
         tracer_provider = trace.NoOpTracerProvider()
         trace.set_tracer_provider(tracer_provider=tracer_provider)
 
-        self._instrumentor = otel_fastapi.FastAPIInstrumentor()
-        self._instrumentor.instrument_app(self.app)
+        _INSTRUMENTOR.instrument_app(self.app)
         self.client = TestClient(self.app)
 
     def tearDown(self) -> None:
         super().tearDown()
-        with self.disable_logging():
-            self._instrumentor.uninstrument_app(self.app)
+        _INSTRUMENTOR.uninstrument_app(self.app)
 
     def test_custom_header_not_present_in_non_recording_span(self):
         resp = self.client.get(
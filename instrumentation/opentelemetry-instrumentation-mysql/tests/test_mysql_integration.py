@@ -117,3 +117,10 @@ class TestMysqlIntegration(TestBase):
 
         spans_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans_list), 1)
+
+    @mock.patch("opentelemetry.instrumentation.dbapi.unwrap_connect")
+    def test_uninstrument_when_not_instrumented(self, mock_unwrap_connect):
+        with self.disable_logging():
+            MySQLInstrumentor().uninstrument()
+
+        mock_unwrap_connect.assert_not_called()
@@ -104,6 +104,7 @@ API
 import logging
 import typing
 from typing import Collection
+from weakref import WeakKeyDictionary
 
 import psycopg  # pylint: disable=import-self
 from psycopg import (
@@ -120,7 +121,9 @@ from opentelemetry.instrumentation.psycopg.package import _instruments
 from opentelemetry.instrumentation.psycopg.version import __version__
 
 _logger = logging.getLogger(__name__)
-_OTEL_CURSOR_FACTORY_KEY = "_otel_orig_cursor_factory"
+# Original cursor factories of connections passed to instrument_connection,
+# kept outside the connection objects so they are not modified further.
+_OTEL_CURSOR_FACTORIES = WeakKeyDictionary()
 
 
 class PsycopgInstrumentor(BaseInstrumentor):
@@ -194,17 +197,11 @@ class PsycopgInstrumentor(BaseInstrumentor):
     # TODO(owais): check if core dbapi can do this for all dbapi implementations e.g, pymysql and mysql
     @staticmethod
     def instrument_connection(connection, tracer_provider=None):
-        if not hasattr(connection, "_is_instrumented_by_opentelemetry"):
-            connection._is_instrumented_by_opentelemetry = False
-
-        if not connection._is_instrumented_by_opentelemetry:
-            setattr(
-                connection, _OTEL_CURSOR_FACTORY_KEY, connection.cursor_factory
-            )
+        if connection not in _OTEL_CURSOR_FACTORIES:
+            _OTEL_CURSOR_FACTORIES[connection] = connection.cursor_factory
             connection.cursor_factory = _new_cursor_factory(
                 tracer_provider=tracer_provider
             )
-            connection._is_instrumented_by_opentelemetry = True
         else:
             _logger.warning(
                 "Attempting to instrument Psycopg connection while already instrumented"
@@ -214,8 +211,8 @@ class PsycopgInstrumentor(BaseInstrumentor):
     # TODO(owais): check if core dbapi can do this for all dbapi implementations e.g, pymysql and mysql
     @staticmethod
     def uninstrument_connection(connection):
-        connection.cursor_factory = getattr(
-            connection, _OTEL_CURSOR_FACTORY_KEY, None
+        connection.cursor_factory = _OTEL_CURSOR_FACTORIES.pop(
+            connection, None
         )
 
         return connection
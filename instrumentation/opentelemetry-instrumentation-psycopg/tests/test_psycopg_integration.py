@@ -458,6 +458,17 @@ class TestPostgresqlIntegration(TestBase):
         spans_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans_list), 1)
 
+    def test_uninstrument_connection_restores_cursor_factory(self):
+        cnx = psycopg.connect(database="test")
+        cnx.cursor_factory = MockCursor
+        PsycopgInstrumentor().instrument_connection(cnx)
+        self.assertIsNot(cnx.cursor_factory, MockCursor)
+        # The original factory is kept outside the connection object.
+        self.assertFalse(hasattr(cnx, "_otel_orig_cursor_factory"))
+
+        cnx = PsycopgInstrumentor().uninstrument_connection(cnx)
+        self.assertIs(cnx.cursor_factory, MockCursor)
+
     @mock.patch("opentelemetry.instrumentation.dbapi.wrap_connect")
     def test_sqlcommenter_enabled(self, event_mocked):
         cnx = psycopg.connect(database="test")
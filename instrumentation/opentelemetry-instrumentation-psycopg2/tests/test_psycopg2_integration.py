@@ -250,6 +250,23 @@ class TestPostgresqlIntegration(TestBase):
         spans_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(spans_list), 1)
 
+    def test_instrument_connection_after_uninstrument_connection(self):
+        cnx = psycopg2.connect(database="test")
+        instrumentor = Psycopg2Instrumentor()
+        instrumentor.instrument_connection(cnx)
+        with self.assertLogs(level="WARNING"):
+            instrumentor.instrument_connection(cnx)
+        self.assertFalse(hasattr(cnx, "_is_instrumented_by_opentelemetry"))
+
+        instrumentor.uninstrument_connection(cnx)
+        instrumentor.instrument_connection(cnx)
+        query = "SELECT * FROM test"
+        cursor = cnx.cursor()
+        cursor.execute(query)
+
+        spans_list = self.memory_exporter.get_finished_spans()
+        self.assertEqual(len(spans_list), 1)
+
     @mock.patch("opentelemetry.instrumentation.dbapi.wrap_connect")
     def test_sqlcommenter_enabled(self, event_mocked):
         cnx = psycopg2.connect(database="test")
@@ -15,6 +15,8 @@
 """
 Some utils used by the redis integration
 """
+from functools import lru_cache
+
 from opentelemetry.semconv.trace import (
     DbSystemValues,
     NetTransportValues,
@@ -50,21 +52,25 @@ def _extract_conn_attributes(conn_kwargs):
 
 def _format_command_args(args):
     """Format and sanitize command arguments, and trim them as needed"""
+    if len(args) > 0:
+        return _format_sanitized_command(str(args[0]), len(args))
+    return ""
+
+
+@lru_cache(maxsize=256)
+def _format_sanitized_command(command, args_length):
+    """Build the sanitized query for a command, cached because it only depends
+    on the command name and its number of arguments"""
     cmd_max_len = 1000
     value_too_long_mark = "..."
 
     # Sanitized query format: "COMMAND ? ?"
-    args_length = len(args)
-    if args_length > 0:
-        out = [str(args[0])] + ["?"] * (args_length - 1)
-        out_str = " ".join(out)
+    out_str = " ".join([command] + ["?"] * (args_length - 1))
 
-        if len(out_str) > cmd_max_len:
-            out_str = (
-                out_str[: cmd_max_len - len(value_too_long_mark)]
-                + value_too_long_mark
-            )
-    else:
-        out_str = ""
+    if len(out_str) > cmd_max_len:
+        out_str = (
+            out_str[: cmd_max_len - len(value_too_long_mark)]
+            + value_too_long_mark
+        )
 
     return out_str
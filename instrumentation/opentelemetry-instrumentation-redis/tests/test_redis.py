@@ -25,13 +25,28 @@ from opentelemetry.semconv.trace import (
     NetTransportValues,
     SpanAttributes,
 )
+from opentelemetry.test.globals_test import reset_trace_globals
 from opentelemetry.test.test_base import TestBase
 from opentelemetry.trace import SpanKind
 
 
 class TestRedis(TestBase):
+    @classmethod
+    def setUpClass(cls):
+        super().setUpClass()
+        cls._tracer_provider_and_exporter = cls.create_tracer_provider()
+
     def setUp(self):
         super().setUp()
+        # Every test uses the provider built once for the class, both
+        # explicitly and as the global provider; only its exporter is reset.
+        (
+            self.tracer_provider,
+            self.memory_exporter,
+        ) = self._tracer_provider_and_exporter
+        reset_trace_globals()
+        trace.set_tracer_provider(self.tracer_provider)
+        self.memory_exporter.clear()
         RedisInstrumentor().instrument(tracer_provider=self.tracer_provider)
 
     def tearDown(self):
@@ -98,31 +113,33 @@ class TestRedis(TestBase):
     def test_instrument_uninstrument_async_client_command(self):
         redis_client = redis.asyncio.Redis()
 
-        with mock.patch.object(redis_client, "connection", AsyncMock()):
-            asyncio.run(redis_client.get("key"))
+        # Run every step on one event loop with a single mocked connection.
+        async def check_commands():
+            await redis_client.get("key")
 
-        spans = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(spans), 1)
-        self.memory_exporter.clear()
+            spans = self.memory_exporter.get_finished_spans()
+            self.assertEqual(len(spans), 1)
+            self.memory_exporter.clear()
 
-        # Test uninstrument
-        RedisInstrumentor().uninstrument()
+            # Test uninstrument
+            RedisInstrumentor().uninstrument()
 
-        with mock.patch.object(redis_client, "connection", AsyncMock()):
-            asyncio.run(redis_client.get("key"))
+            await redis_client.get("key")
 
-        spans = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(spans), 0)
-        self.memory_exporter.clear()
+            spans = self.memory_exporter.get_finished_spans()
+            self.assertEqual(len(spans), 0)
+            self.memory_exporter.clear()
 
-        # Test instrument again
-        RedisInstrumentor().instrument()
+            # Test instrument again
+            RedisInstrumentor().instrument()
 
-        with mock.patch.object(redis_client, "connection", AsyncMock()):
-            asyncio.run(redis_client.get("key"))
+            await redis_client.get("key")
 
-        spans = self.memory_exporter.get_finished_spans()
-        self.assertEqual(len(spans), 1)
+            spans = self.memory_exporter.get_finished_spans()
+            self.assertEqual(len(spans), 1)
+
+        with mock.patch.object(redis_client, "connection", AsyncMock()):
+            asyncio.run(check_commands())
 
     def test_response_hook(self):
         redis_client = redis.Redis()
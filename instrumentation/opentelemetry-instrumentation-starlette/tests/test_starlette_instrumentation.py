@@ -60,6 +60,17 @@ _recommended_attrs = {
 }
 
 
+def _server_span(spans):
+    return next(span for span in spans if span.kind is SpanKind.SERVER)
+
+
+_CUSTOM_HEADERS_ENV = {
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
+    OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
+}
+
+
 class TestStarletteManualInstrumentation(TestBase):
     def _create_app(self):
         app = self._create_starlette_app()
@@ -468,14 +479,7 @@ class TestBaseWithCustomHeaders(TestBase):
 
 
 class TestHTTPAppWithCustomHeaders(TestBaseWithCustomHeaders):
-    @patch.dict(
-        "os.environ",
-        {
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
-        },
-    )
+    @patch.dict("os.environ", _CUSTOM_HEADERS_ENV)
     def setUp(self) -> None:
         super().setUp()
 
@@ -507,9 +511,7 @@ class TestHTTPAppWithCustomHeaders(TestBaseWithCustomHeaders):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
-        server_span = [
-            span for span in span_list if span.kind == SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         self.assertSpanHasAttributes(server_span, expected)
 
@@ -540,9 +542,7 @@ class TestHTTPAppWithCustomHeaders(TestBaseWithCustomHeaders):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
-        server_span = [
-            span for span in span_list if span.kind == SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         for key in not_expected:
             self.assertNotIn(key, server_span.attributes)
@@ -568,9 +568,7 @@ class TestHTTPAppWithCustomHeaders(TestBaseWithCustomHeaders):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
-        server_span = [
-            span for span in span_list if span.kind == SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         self.assertSpanHasAttributes(server_span, expected)
 
@@ -585,23 +583,14 @@ class TestHTTPAppWithCustomHeaders(TestBaseWithCustomHeaders):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 3)
 
-        server_span = [
-            span for span in span_list if span.kind == SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         for key in not_expected:
             self.assertNotIn(key, server_span.attributes)
 
 
 class TestWebSocketAppWithCustomHeaders(TestBaseWithCustomHeaders):
-    @patch.dict(
-        "os.environ",
-        {
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
-        },
-    )
+    @patch.dict("os.environ", _CUSTOM_HEADERS_ENV)
     def setUp(self) -> None:
         super().setUp()
 
@@ -635,9 +624,7 @@ class TestWebSocketAppWithCustomHeaders(TestBaseWithCustomHeaders):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
         self.assertSpanHasAttributes(server_span, expected)
 
     def test_custom_request_headers_not_in_span_attributes(self):
@@ -662,9 +649,7 @@ class TestWebSocketAppWithCustomHeaders(TestBaseWithCustomHeaders):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         for key, _ in not_expected.items():
             self.assertNotIn(key, server_span.attributes)
@@ -692,9 +677,7 @@ class TestWebSocketAppWithCustomHeaders(TestBaseWithCustomHeaders):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         self.assertSpanHasAttributes(server_span, expected)
 
@@ -711,22 +694,13 @@ class TestWebSocketAppWithCustomHeaders(TestBaseWithCustomHeaders):
         span_list = self.memory_exporter.get_finished_spans()
         self.assertEqual(len(span_list), 5)
 
-        server_span = [
-            span for span in span_list if span.kind == SpanKind.SERVER
-        ][0]
+        server_span = _server_span(span_list)
 
         for key, _ in not_expected.items():
             self.assertNotIn(key, server_span.attributes)
 
 
-@patch.dict(
-    "os.environ",
-    {
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS: ".*my-secret.*",
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,Regex-Test-Header-.*,Regex-Invalid-Test-Header-.*,.*my-secret.*",
-        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE: "Custom-Test-Header-1,Custom-Test-Header-2,Custom-Test-Header-3,my-custom-regex-header-.*,invalid-regex-header-.*,.*my-secret.*",
-    },
-)
+@patch.dict("os.environ", _CUSTOM_HEADERS_ENV)
 class TestNonRecordingSpanWithCustomHeaders(TestBaseWithCustomHeaders):
     def setUp(self):
         super().setUp()
@@ -389,6 +389,12 @@ def collect_custom_request_headers_attributes(environ):
     in the specification https://github.com/open-telemetry/opentelemetry-specification/blob/main/specification/trace/semantic_conventions/http.md#http-request-and-response-headers
     """
 
+    header_regexes = get_custom_headers(
+        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST
+    )
+    if not header_regexes:
+        return {}
+
     sanitize = SanitizeValue(
         get_custom_headers(
             OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS
@@ -402,9 +408,7 @@ def collect_custom_request_headers_attributes(environ):
 
     return sanitize.sanitize_header_values(
         headers,
-        get_custom_headers(
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_REQUEST
-        ),
+        header_regexes,
         normalise_request_header_name,
     )
 
@@ -415,6 +419,12 @@ def collect_custom_response_headers_attributes(response_headers):
     https://github.com/open-telemetry/opentelemetry-specification/blob/main/specification/trace/semantic_conventions/http.md#http-request-and-response-headers
     """
 
+    header_regexes = get_custom_headers(
+        OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE
+    )
+    if not header_regexes:
+        return {}
+
     sanitize = SanitizeValue(
         get_custom_headers(
             OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SANITIZE_FIELDS
@@ -431,9 +441,7 @@ def collect_custom_response_headers_attributes(response_headers):
 
     return sanitize.sanitize_header_values(
         response_headers_dict,
-        get_custom_headers(
-            OTEL_INSTRUMENTATION_HTTP_CAPTURE_HEADERS_SERVER_RESPONSE
-        ),
+        header_regexes,
         normalise_response_header_name,
     )
 
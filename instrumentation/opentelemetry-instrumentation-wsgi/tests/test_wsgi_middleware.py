@@ -935,6 +935,18 @@ class TestAdditionOfCustomRequestResponseHeaders(WsgiTestBase):
         }
         self.assertSpanHasAttributes(span, expected)
 
+    def test_custom_headers_not_configured(self):
+        self.environ.update({"HTTP_CUSTOM_TEST_HEADER_1": "Test Value 1"})
+        app = otel_wsgi.OpenTelemetryMiddleware(simple_wsgi)
+        with mock.patch.object(otel_wsgi, "SanitizeValue") as sanitize:
+            response = app(self.environ, self.start_response)
+            self.iterate_response(response)
+        sanitize.assert_not_called()
+        span = self.memory_exporter.get_finished_spans()[0]
+        self.assertNotIn(
+            "http.request.header.custom_test_header_1", span.attributes
+        )
+
     @mock.patch.dict(
         "os.environ",
         {
@@ -52,23 +52,33 @@ _FUNCTIONS_ATTRIBUTE_ENV_VARS = {
 
 # Vm
 
-_AZURE_VM_METADATA_ENDPOINT = "http://169.254.169.254/metadata/instance/compute?api-version=2021-12-13&format=json"
+# Azure VMs report this DMI system vendor on Linux
+_DMI_SYS_VENDOR_PATH = "/sys/class/dmi/id/sys_vendor"
+_MICROSOFT_SYS_VENDOR = b"Microsoft Corporation"
+_AZURE_VM_METADATA_HOST = "169.254.169.254"
+# Off Azure nothing answers on the link-local address, so a short connect
+# timeout bounds every failed detect, while the response itself may take
+# up to the read timeout
+_AZURE_VM_METADATA_CONNECT_TIMEOUT = 0.05
+_AZURE_VM_METADATA_READ_TIMEOUT = 0.2
+_AZURE_VM_METADATA_PATH = (
+    "/metadata/instance/compute?api-version=2021-12-13&format=json"
+)
 _AZURE_VM_SCALE_SET_NAME_ATTRIBUTE = "azure.vm.scaleset.name"
 _AZURE_VM_SKU_ATTRIBUTE = "azure.vm.sku"
 
-_EXPECTED_AZURE_AMS_ATTRIBUTES = [
-    _AZURE_VM_SCALE_SET_NAME_ATTRIBUTE,
-    _AZURE_VM_SKU_ATTRIBUTE,
-    ResourceAttributes.CLOUD_PLATFORM,
-    ResourceAttributes.CLOUD_PROVIDER,
-    ResourceAttributes.CLOUD_REGION,
-    ResourceAttributes.CLOUD_RESOURCE_ID,
-    ResourceAttributes.HOST_ID,
-    ResourceAttributes.HOST_NAME,
-    ResourceAttributes.HOST_TYPE,
-    ResourceAttributes.OS_TYPE,
-    ResourceAttributes.OS_VERSION,
-    ResourceAttributes.SERVICE_INSTANCE_ID,
-]
+# Constant cloud.platform/cloud.provider values are set by the detector itself
+_AZURE_VM_ATTRIBUTE_METADATA_KEYS = {
+    _AZURE_VM_SCALE_SET_NAME_ATTRIBUTE: "vmScaleSetName",
+    _AZURE_VM_SKU_ATTRIBUTE: "sku",
+    ResourceAttributes.CLOUD_REGION: "location",
+    ResourceAttributes.CLOUD_RESOURCE_ID: "resourceId",
+    ResourceAttributes.HOST_ID: "vmId",
+    ResourceAttributes.HOST_NAME: "name",
+    ResourceAttributes.HOST_TYPE: "vmSize",
+    ResourceAttributes.OS_TYPE: "osType",
+    ResourceAttributes.OS_VERSION: "version",
+    ResourceAttributes.SERVICE_INSTANCE_ID: "vmId",
+}
 
 # cSpell:enable
@@ -16,7 +16,9 @@ from typing import Optional
 
 from ._constants import (
     _AKS_ARM_NAMESPACE_ID,
+    _DMI_SYS_VENDOR_PATH,
     _FUNCTIONS_WORKER_RUNTIME,
+    _MICROSOFT_SYS_VENDOR,
     _WEBSITE_OWNER_NAME,
     _WEBSITE_RESOURCE_GROUP,
     _WEBSITE_SITE_NAME,
@@ -35,20 +37,43 @@ def _is_on_functions() -> bool:
     return environ.get(_FUNCTIONS_WORKER_RUNTIME) is not None
 
 
+def _may_be_on_azure_vm() -> bool:
+    # Reading sysfs is far cheaper than waiting for the IMDS request to time
+    # out on hosts that are clearly not Azure VMs.
+    try:
+        with open(_DMI_SYS_VENDOR_PATH, "rb") as sys_vendor:
+            return _MICROSOFT_SYS_VENDOR in sys_vendor.read(64)
+    except OSError:
+        # Not on Linux or not readable, let IMDS decide
+        return True
+
+
 def _can_ignore_vm_detect() -> bool:
-    return _is_on_aks() or _is_on_app_service() or _is_on_functions()
+    return (
+        _is_on_aks()
+        or _is_on_app_service()
+        or _is_on_functions()
+        or not _may_be_on_azure_vm()
+    )
 
 
-def _get_azure_resource_uri() -> Optional[str]:
-    website_site_name = environ.get(_WEBSITE_SITE_NAME)
+def _get_azure_resource_uri(
+    website_site_name: Optional[str] = None,
+) -> Optional[str]:
+    # Detectors that already read WEBSITE_SITE_NAME pass it in so the
+    # variable is only looked up once.
+    if website_site_name is None:
+        website_site_name = environ.get(_WEBSITE_SITE_NAME)
     website_resource_group = environ.get(_WEBSITE_RESOURCE_GROUP)
     website_owner_name = environ.get(_WEBSITE_OWNER_NAME)
+    if not (
+        website_site_name and website_resource_group and website_owner_name
+    ):
+        return None
 
-    subscription_id = website_owner_name
-    if website_owner_name and "+" in website_owner_name:
-        subscription_id = website_owner_name[0 : website_owner_name.index("+")]
-
-    if not (website_site_name and website_resource_group and subscription_id):
+    # The owner name is "<subscription id>+<webspace>" or just the id
+    subscription_id = website_owner_name.partition("+")[0]
+    if not subscription_id:
         return None
 
     return f"/subscriptions/{subscription_id}/resourceGroups/{website_resource_group}/providers/Microsoft.Web/sites/{website_site_name}"
@@ -32,7 +32,15 @@ from opentelemetry.resource.detector.azure._utils import _is_on_functions
 
 
 class AzureAppServiceResourceDetector(ResourceDetector):
+    def __init__(self, raise_on_error: bool = False) -> None:
+        super().__init__(raise_on_error=raise_on_error)
+        # App Service environment variables are fixed for the lifetime of
+        # the process, so the detected resource is reused.
+        self._resource: Optional[Resource] = None
+
     def detect(self) -> Resource:
+        if self._resource is not None:
+            return self._resource
         attributes = {}
         website_site_name = environ.get(_WEBSITE_SITE_NAME)
         if website_site_name:
@@ -46,7 +54,7 @@ class AzureAppServiceResourceDetector(ResourceDetector):
                 CloudProviderValues.AZURE.value
             )
 
-            azure_resource_uri = _get_azure_resource_uri()
+            azure_resource_uri = _get_azure_resource_uri(website_site_name)
             if azure_resource_uri:
                 attributes[ResourceAttributes.CLOUD_RESOURCE_ID] = (
                     azure_resource_uri
@@ -56,4 +64,7 @@ class AzureAppServiceResourceDetector(ResourceDetector):
                 if value:
                     attributes[key] = value
 
-        return Resource(attributes)
+        self._resource = (
+            Resource(attributes) if attributes else Resource.get_empty()
+        )
+        return self._resource
@@ -49,7 +49,7 @@ class AzureFunctionsResourceDetector(ResourceDetector):
             cloud_region = environ.get(_REGION_NAME)
             if cloud_region:
                 attributes[ResourceAttributes.CLOUD_REGION] = cloud_region
-            azure_resource_uri = _get_azure_resource_uri()
+            azure_resource_uri = _get_azure_resource_uri(website_site_name)
             if azure_resource_uri:
                 attributes[ResourceAttributes.CLOUD_RESOURCE_ID] = (
                     azure_resource_uri
@@ -64,5 +64,7 @@ class AzureFunctionsResourceDetector(ResourceDetector):
                             continue
                     attributes[key] = value
 
+        if not attributes:
+            return Resource.get_empty()
         return Resource(attributes)
 
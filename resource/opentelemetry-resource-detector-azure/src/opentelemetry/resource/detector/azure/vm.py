@@ -12,10 +12,10 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 
+from http.client import HTTPConnection, HTTPException
 from json import loads
 from logging import getLogger
-from urllib.error import URLError
-from urllib.request import Request, urlopen
+from typing import Optional
 
 from opentelemetry.context import (
     _SUPPRESS_INSTRUMENTATION_KEY,
@@ -31,73 +31,75 @@ from opentelemetry.semconv.resource import (
 )
 
 from ._constants import (
-    _AZURE_VM_METADATA_ENDPOINT,
-    _AZURE_VM_SCALE_SET_NAME_ATTRIBUTE,
-    _AZURE_VM_SKU_ATTRIBUTE,
-    _EXPECTED_AZURE_AMS_ATTRIBUTES,
+    _AZURE_VM_ATTRIBUTE_METADATA_KEYS,
+    _AZURE_VM_METADATA_CONNECT_TIMEOUT,
+    _AZURE_VM_METADATA_HOST,
+    _AZURE_VM_METADATA_PATH,
+    _AZURE_VM_METADATA_READ_TIMEOUT,
 )
 from ._utils import _can_ignore_vm_detect
 
 _logger = getLogger(__name__)
 
+_AZURE_VM_CLOUD_ATTRIBUTES = {
+    ResourceAttributes.CLOUD_PLATFORM: CloudPlatformValues.AZURE_VM.value,
+    ResourceAttributes.CLOUD_PROVIDER: CloudProviderValues.AZURE.value,
+}
+
 
 class AzureVMResourceDetector(ResourceDetector):
-    # pylint: disable=no-self-use
+    def __init__(self, raise_on_error: bool = False) -> None:
+        super().__init__(raise_on_error=raise_on_error)
+        # The IMDS metadata does not change while the process runs, so a
+        # successful detection is reused. Failures are not cached since the
+        # request may only have timed out.
+        self._resource: Optional[Resource] = None
+
     def detect(self) -> "Resource":
-        attributes = {}
+        if self._resource is not None:
+            return self._resource
         if not _can_ignore_vm_detect():
             token = attach(set_value(_SUPPRESS_INSTRUMENTATION_KEY, True))
-            metadata_json = _get_azure_vm_metadata()
-            if not metadata_json:
-                return Resource(attributes)
-            for attribute_key in _EXPECTED_AZURE_AMS_ATTRIBUTES:
-                attributes[attribute_key] = _get_attribute_from_metadata(
-                    metadata_json, attribute_key
-                )
-            detach(token)
-        return Resource(attributes)
+            try:
+                metadata_json = _get_azure_vm_metadata()
+            finally:
+                detach(token)
+            if metadata_json:
+                attributes = {
+                    attribute_key: metadata_json[metadata_key]
+                    for (
+                        attribute_key,
+                        metadata_key,
+                    ) in _AZURE_VM_ATTRIBUTE_METADATA_KEYS.items()
+                }
+                attributes.update(_AZURE_VM_CLOUD_ATTRIBUTES)
+                self._resource = Resource(attributes)
+                return self._resource
+        return Resource.get_empty()
 
 
 def _get_azure_vm_metadata():
-    request = Request(_AZURE_VM_METADATA_ENDPOINT)
-    request.add_header("Metadata", "True")
+    # IMDS is always a plain HTTP GET to a fixed link-local host, so a bare
+    # HTTPConnection avoids building urllib's opener chain on startup.
+    connection = HTTPConnection(
+        _AZURE_VM_METADATA_HOST, timeout=_AZURE_VM_METADATA_CONNECT_TIMEOUT
+    )
     try:
+        connection.connect()
         # VM metadata service should not take more than 200ms on success case
-        with urlopen(request, timeout=0.2) as response:
-            return loads(response.read())
-    except URLError:
+        connection.sock.settimeout(_AZURE_VM_METADATA_READ_TIMEOUT)
+        connection.request(
+            "GET", _AZURE_VM_METADATA_PATH, headers={"Metadata": "True"}
+        )
+        response = connection.getresponse()
+        if response.status != 200:
+            return None
+        return loads(response.read())
+    except (OSError, HTTPException):
         # Not on Azure VM
         return None
     except Exception as e:  # pylint: disable=broad-except,invalid-name
         _logger.exception("Failed to receive Azure VM metadata: %s", e)
         return None
-
-
-def _get_attribute_from_metadata(metadata_json, attribute_key):
-    ams_value = ""
-    if attribute_key == _AZURE_VM_SCALE_SET_NAME_ATTRIBUTE:
-        ams_value = metadata_json["vmScaleSetName"]
-    elif attribute_key == _AZURE_VM_SKU_ATTRIBUTE:
-        ams_value = metadata_json["sku"]
-    elif attribute_key == ResourceAttributes.CLOUD_PLATFORM:
-        ams_value = CloudPlatformValues.AZURE_VM.value
-    elif attribute_key == ResourceAttributes.CLOUD_PROVIDER:
-        ams_value = CloudProviderValues.AZURE.value
-    elif attribute_key == ResourceAttributes.CLOUD_REGION:
-        ams_value = metadata_json["location"]
-    elif attribute_key == ResourceAttributes.CLOUD_RESOURCE_ID:
-        ams_value = metadata_json["resourceId"]
-    elif attribute_key in (
-        ResourceAttributes.HOST_ID,
-        ResourceAttributes.SERVICE_INSTANCE_ID,
-    ):
-        ams_value = metadata_json["vmId"]
-    elif attribute_key == ResourceAttributes.HOST_NAME:
-        ams_value = metadata_json["name"]
-    elif attribute_key == ResourceAttributes.HOST_TYPE:
-        ams_value = metadata_json["vmSize"]
-    elif attribute_key == ResourceAttributes.OS_TYPE:
-        ams_value = metadata_json["osType"]
-    elif attribute_key == ResourceAttributes.OS_VERSION:
-        ams_value = metadata_json["version"]
-    return ams_value
+    finally:
+        connection.close()
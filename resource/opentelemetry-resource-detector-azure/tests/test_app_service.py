@@ -191,3 +191,30 @@ class TestAzureAppServiceResourceDetector(unittest.TestCase):
     def test_off_app_service(self):
         resource = AzureAppServiceResourceDetector().detect()
         self.assertEqual(resource.attributes, {})
+
+    @patch.dict(
+        "os.environ",
+        {"WEBSITE_SITE_NAME": TEST_WEBSITE_SITE_NAME},
+        clear=True,
+    )
+    def test_detect_is_cached(self):
+        detector = AzureAppServiceResourceDetector()
+        resource = detector.detect()
+        with patch.dict("os.environ", {}, clear=True):
+            self.assertIs(detector.detect(), resource)
+
+    @patch.dict(
+        "os.environ",
+        {
+            "WEBSITE_SITE_NAME": TEST_WEBSITE_SITE_NAME,
+            "WEBSITE_RESOURCE_GROUP": TEST_WEBSITE_RESOURCE_GROUP,
+            "WEBSITE_OWNER_NAME": f"{TEST_WEBSITE_OWNER_NAME}+webspace",
+        },
+        clear=True,
+    )
+    def test_owner_name_with_webspace(self):
+        attributes = AzureAppServiceResourceDetector().detect().attributes
+        self.assertEqual(
+            attributes["cloud.resource_id"],
+            f"/subscriptions/{TEST_WEBSITE_OWNER_NAME}/resourceGroups/{TEST_WEBSITE_RESOURCE_GROUP}/providers/Microsoft.Web/sites/{TEST_WEBSITE_SITE_NAME}",
+        )
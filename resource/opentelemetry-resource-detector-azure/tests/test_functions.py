@@ -18,6 +18,7 @@ from unittest.mock import patch
 from opentelemetry.resource.detector.azure.functions import (
     AzureFunctionsResourceDetector,
 )
+from opentelemetry.sdk.resources import Resource
 
 TEST_WEBSITE_SITE_NAME = "TEST_WEBSITE_SITE_NAME"
 TEST_REGION_NAME = "TEST_REGION_NAME"
@@ -108,3 +109,4 @@ class TestAzureAppServiceResourceDetector(unittest.TestCase):
     def test_off_app_service(self):
         resource = AzureFunctionsResourceDetector().detect()
         self.assertEqual(resource.attributes, {})
+        self.assertIs(resource, Resource.get_empty())
@@ -12,9 +12,12 @@
 # See the License for the specific language governing permissions and
 # limitations under the License.
 import unittest
-from unittest.mock import patch
+from unittest.mock import mock_open, patch
+
+from opentelemetry.context import _SUPPRESS_INSTRUMENTATION_KEY, get_value
 
 # pylint: disable=no-name-in-module
+from opentelemetry.resource.detector.azure._utils import _may_be_on_azure_vm
 from opentelemetry.resource.detector.azure.vm import AzureVMResourceDetector
 
 LINUX_JSON = """
@@ -360,31 +363,106 @@ WINDOWS_ATTRIBUTES = {
 }
 
 
+def _mock_response(mock_connection, body, status=200):
+    response = mock_connection.return_value.getresponse.return_value
+    response.status = status
+    response.read.return_value = body
+
+
 class TestAzureVMResourceDetector(unittest.TestCase):
-    @patch("opentelemetry.resource.detector.azure.vm.urlopen")
-    def test_linux(self, mock_urlopen):
-        mock_urlopen.return_value.__enter__.return_value.read.return_value = (
-            LINUX_JSON
+    def setUp(self):
+        patcher = patch(
+            "opentelemetry.resource.detector.azure._utils._may_be_on_azure_vm",
+            return_value=True,
         )
+        self.may_be_on_azure_vm_mock = patcher.start()
+        self.addCleanup(patcher.stop)
+
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_linux(self, mock_connection):
+        _mock_response(mock_connection, LINUX_JSON)
         attributes = AzureVMResourceDetector().detect().attributes
         for attribute_key, attribute_value in LINUX_ATTRIBUTES.items():
             self.assertEqual(attributes[attribute_key], attribute_value)
 
-    @patch("opentelemetry.resource.detector.azure.vm.urlopen")
-    def test_windows(self, mock_urlopen):
-        mock_urlopen.return_value.__enter__.return_value.read.return_value = (
-            WINDOWS_JSON
-        )
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_windows(self, mock_connection):
+        _mock_response(mock_connection, WINDOWS_JSON)
         attributes = AzureVMResourceDetector().detect().attributes
         for attribute_key, attribute_value in WINDOWS_ATTRIBUTES.items():
             self.assertEqual(attributes[attribute_key], attribute_value)
 
     @patch("opentelemetry.resource.detector.azure.vm._can_ignore_vm_detect")
-    @patch("opentelemetry.resource.detector.azure.vm.urlopen")
-    def test_in_another_rp(self, mock_urlopen, detect_mock):
-        mock_urlopen.return_value.__enter__.return_value.read.return_value = (
-            LINUX_JSON
-        )
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_in_another_rp(self, mock_connection, detect_mock):
+        _mock_response(mock_connection, LINUX_JSON)
         detect_mock.return_value = True
         attributes = AzureVMResourceDetector().detect().attributes
         self.assertEqual(attributes, {})
+
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_detect_is_cached(self, mock_connection):
+        _mock_response(mock_connection, LINUX_JSON)
+        detector = AzureVMResourceDetector()
+        resource = detector.detect()
+        self.assertIs(detector.detect(), resource)
+        mock_connection.return_value.request.assert_called_once()
+
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_not_found(self, mock_connection):
+        _mock_response(mock_connection, "", status=404)
+        attributes = AzureVMResourceDetector().detect().attributes
+        self.assertEqual(attributes, {})
+        mock_connection.return_value.close.assert_called_once()
+
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_not_on_azure_vm(self, mock_connection):
+        mock_connection.return_value.request.side_effect = OSError()
+        attributes = AzureVMResourceDetector().detect().attributes
+        self.assertEqual(attributes, {})
+        mock_connection.return_value.close.assert_called_once()
+
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_context_detached_without_metadata(self, mock_connection):
+        mock_connection.return_value.request.side_effect = OSError()
+        AzureVMResourceDetector().detect()
+        self.assertIsNone(get_value(_SUPPRESS_INSTRUMENTATION_KEY))
+
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_not_azure_sys_vendor(self, mock_connection):
+        self.may_be_on_azure_vm_mock.return_value = False
+        attributes = AzureVMResourceDetector().detect().attributes
+        self.assertEqual(attributes, {})
+        mock_connection.assert_not_called()
+
+    def test_may_be_on_azure_vm(self):
+        with patch(
+            "builtins.open", mock_open(read_data=b"Microsoft Corporation\n")
+        ):
+            self.assertTrue(_may_be_on_azure_vm())
+        with patch("builtins.open", mock_open(read_data=b"QEMU\n")):
+            self.assertFalse(_may_be_on_azure_vm())
+        with patch("builtins.open", side_effect=FileNotFoundError()):
+            self.assertTrue(_may_be_on_azure_vm())
+
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_failed_detect_is_not_cached(self, mock_connection):
+        mock_connection.return_value.request.side_effect = OSError()
+        detector = AzureVMResourceDetector()
+        self.assertEqual(detector.detect().attributes, {})
+        mock_connection.return_value.request.side_effect = None
+        _mock_response(mock_connection, LINUX_JSON)
+        attributes = detector.detect().attributes
+        for attribute_key, attribute_value in LINUX_ATTRIBUTES.items():
+            self.assertEqual(attributes[attribute_key], attribute_value)
+
+    @patch("opentelemetry.resource.detector.azure.vm.HTTPConnection")
+    def test_connect_timeout_shorter_than_read_timeout(self, mock_connection):
+        _mock_response(mock_connection, LINUX_JSON)
+        AzureVMResourceDetector().detect()
+        connect_timeout = mock_connection.call_args.kwargs["timeout"]
+        mock_connection.return_value.sock.settimeout.assert_called_once()
+        (read_timeout,) = (
+            mock_connection.return_value.sock.settimeout.call_args.args
+        )
+        self.assertLess(connect_timeout, read_timeout)
@@ -14,8 +14,10 @@
 
 from __future__ import annotations
 
+from functools import lru_cache
 from os import environ
 from re import IGNORECASE as RE_IGNORECASE
+from re import Pattern
 from re import compile as re_compile
 from re import search
 from typing import Callable, Iterable, Optional
@@ -70,6 +72,32 @@ class ExcludeList:
         return bool(self._excluded_urls and search(self._regex, url))
 
 
+_REGEX_METACHARACTERS = frozenset(".^$*+?{}[]\\|()")
+
+
+@lru_cache(maxsize=128)
+def _compile_header_regexes(
+    header_regexes: tuple[str, ...],
+) -> tuple[frozenset[str], Optional[Pattern[str]]]:
+    """Splits the configured header names into plain names, matched with a
+    set lookup, and regexes, compiled into a single anchored,
+    case-insensitive pattern. The result is cached because the same header
+    configuration is used for every request."""
+    literals = set()
+    regexes = []
+    for header_regex in header_regexes:
+        if _REGEX_METACHARACTERS.isdisjoint(header_regex):
+            literals.add(header_regex.lower())
+        else:
+            regexes.append(header_regex)
+
+    return frozenset(literals), (
+        re_compile("|".join("^" + i + "$" for i in regexes), RE_IGNORECASE)
+        if regexes
+        else None
+    )
+
+
 class SanitizeValue:
     """Class to sanitize (remove sensitive data from) certain headers (given as a list of regexes)"""
 
@@ -94,25 +122,25 @@ class SanitizeValue:
         values: dict[str, str] = {}
 
         if header_regexes:
-            header_regexes_compiled = re_compile(
-                "|".join("^" + i + "$" for i in header_regexes),
-                RE_IGNORECASE,
+            literals, header_regexes_compiled = _compile_header_regexes(
+                tuple(header_regexes)
             )
 
-            for header_name in list(
-                filter(
-                    header_regexes_compiled.match,
-                    headers.keys(),
-                )
-            ):
-                header_values = headers.get(header_name)
-                if header_values:
-                    key = normalize_function(header_name.lower())
-                    values[key] = [
-                        self.sanitize_header_value(
-                            header=header_name, value=header_values
-                        )
-                    ]
+            for header_name, header_values in headers.items():
+                name = header_name.lower()
+                if not header_values or (
+                    name not in literals
+                    and not (
+                        header_regexes_compiled
+                        and header_regexes_compiled.match(header_name)
+                    )
+                ):
+                    continue
+                values[normalize_function(name)] = [
+                    self.sanitize_header_value(
+                        header=header_name, value=header_values
+                    )
+                ]
 
         return values
 
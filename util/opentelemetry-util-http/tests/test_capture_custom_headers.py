@@ -109,3 +109,34 @@ class TestCaptureCustomHeaders(unittest.TestCase):
     def test_normalise_response_header_name(self):
         key = normalise_response_header_name("Test-Header")
         self.assertEqual(key, "http.response.header.test_header")
+
+    def test_sanitize_header_values(self):
+        sanitize = SanitizeValue(["secret"])
+        headers = {
+            "custom-test-header": "test-value",
+            "regex-test-header-1": "regex-value",
+            "my-secret-header": "my-secret-value",
+            "other-header": "other-value",
+            "CUSTOM-TEST-HEADER-2": "upper-value",
+        }
+        header_regexes = [
+            "Custom-Test-Header",
+            "Custom-Test-Header-2",
+            "Regex-Test-Header-.*",
+            "My-Secret-Header",
+        ]
+        expected = {
+            "http.request.header.custom_test_header": ["test-value"],
+            "http.request.header.regex_test_header_1": ["regex-value"],
+            "http.request.header.my_secret_header": ["[REDACTED]"],
+            "http.request.header.custom_test_header_2": ["upper-value"],
+        }
+
+        # The second call reuses the compiled header regexes.
+        for _ in range(2):
+            self.assertEqual(
+                sanitize.sanitize_header_values(
+                    headers, header_regexes, normalise_request_header_name
+                ),
+                expected,
+            )